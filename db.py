@@ -12,15 +12,233 @@ Existing functionality:
 - Export utilities
 """
 
+import csv
 import os
 import sqlite3
-import pandas as pd
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List, TextIO, Union
 
 DEFAULT_DB_PATH = "/app/data/robo_advisor.db"
 
+# One connection per thread, reused across calls (Streamlit serves each
+# session from its own script thread).
+_local = threading.local()
+
+# Serialises writers across threads sharing the same database file.
+_write_lock = threading.Lock()
+
+# Bumped after every committed registrations write; keys the
+# fetch_latest_registrations cache so stale rows are never served.
+_reg_write_version = 0
+_latest_regs_cache: Dict[tuple, List[sqlite3.Row]] = {}
+
+# Applied once when a connection is opened. WAL needs a real file, so it
+# is skipped for ":memory:" databases.
+_WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Size of each connection's prepared-statement cache
+_STATEMENT_CACHE_SIZE = 256
+
+# Rows fetched per batch when streaming CSV exports
+EXPORT_BATCH_SIZE = 1000
+
+# Bulk loads at least this large refresh planner statistics (ANALYZE)
+_ANALYZE_MIN_ROWS = 100
+
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Goals schema (Phase 3 Iteration 2); {table} lets the migration reuse it
+_GOALS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        goal_id TEXT PRIMARY KEY NOT NULL,
+        registration_id INTEGER,
+        corpus REAL NOT NULL,
+        sip REAL NOT NULL,
+        horizon INTEGER NOT NULL,
+        risk_category TEXT NOT NULL,
+        conservative_projection REAL,
+        expected_projection REAL,
+        best_case_projection REAL,
+        confidence TEXT,
+        adjusted_return REAL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        status TEXT DEFAULT 'saved',
+        email_sent_at TEXT,
+        revisited_at TEXT,
+        FOREIGN KEY (registration_id) REFERENCES registrations(id)
+    ) WITHOUT ROWID
+"""
+
+# Bump whenever _SCHEMA_SQL changes; init_db() skips databases already
+# stamped with this PRAGMA user_version.
+SCHEMA_VERSION = 2
+
+# Full schema, applied by init_db() as a single script/transaction.
+_SCHEMA_SQL = f"""
+BEGIN IMMEDIATE;
+
+-- =========================================================
+-- REGISTRATIONS TABLE (Phase 2 - Existing)
+-- =========================================================
+CREATE TABLE IF NOT EXISTS registrations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    email TEXT NOT NULL,
+    city TEXT,
+    country TEXT,
+    consent INTEGER NOT NULL,
+    consent_ts TEXT NOT NULL,
+    questionnaire_completed INTEGER NOT NULL DEFAULT 1,
+    recommendations_viewed INTEGER NOT NULL DEFAULT 0,
+    risk_score INTEGER,
+    risk_category TEXT,
+    created_ts TEXT NOT NULL DEFAULT (datetime('now')),
+    user_id TEXT
+);
+
+-- Indexes as per SRS (email, country)
+CREATE INDEX IF NOT EXISTS idx_reg_email ON registrations(email);
+CREATE INDEX IF NOT EXISTS idx_reg_country ON registrations(country);
+
+-- Analytics: top-cities GROUP BY and recommendations-viewed count
+CREATE INDEX IF NOT EXISTS idx_reg_city_country
+    ON registrations(city, country);
+CREATE INDEX IF NOT EXISTS idx_reg_recos
+    ON registrations(recommendations_viewed)
+    WHERE recommendations_viewed = 1;
+
+-- Admin list / CSV export: ORDER BY created_ts DESC walks the index
+CREATE INDEX IF NOT EXISTS idx_reg_created_ts
+    ON registrations(created_ts DESC);
+
+-- =========================================================
+-- GOALS TABLE (Phase 3 Iteration 2 - New)
+-- =========================================================
+-- goal_id is the clustered primary key (WITHOUT ROWID), so
+-- lookups by goal_id need no secondary index.
+{_GOALS_TABLE_SQL.format(table="goals")};
+
+CREATE INDEX IF NOT EXISTS idx_goal_reg_id ON goals(registration_id);
+CREATE INDEX IF NOT EXISTS idx_goal_created_at ON goals(created_at DESC);
+
+-- Analytics: get_goals_analytics GROUP BY status walks this index
+DROP INDEX IF EXISTS idx_goal_status_active;
+CREATE INDEX IF NOT EXISTS idx_goal_status ON goals(status);
+
+CREATE INDEX IF NOT EXISTS idx_goal_confidence ON goals(confidence);
+CREATE INDEX IF NOT EXISTS idx_goal_risk ON goals(risk_category);
+
+PRAGMA user_version = {SCHEMA_VERSION};
+
+COMMIT;
+"""
+
+# Registration CSV export layout; the SELECT is generated from it so the
+# header and row positions can never drift apart.
+_REG_EXPORT_COLUMNS = (
+    "id",
+    "name",
+    "email",
+    "city",
+    "country",
+    "consent",
+    "consent_ts",
+    "questionnaire_completed",
+    "recommendations_viewed",
+    "risk_score",
+    "risk_category",
+    "created_ts",
+    "user_id",
+)
+_EXPORT_REG_SQL = (
+    f"SELECT {', '.join(_REG_EXPORT_COLUMNS)} "
+    "FROM registrations ORDER BY created_ts DESC"
+)
+
+# UTC ISO-8601 timestamp (seconds) minted by SQLite itself, so write paths
+# never build a datetime/string per row. 'now' is stable within one
+# statement step, so repeated uses in a statement agree.
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%S', 'now')"
+
+# Hot-path statements kept as constants so the connection's statement
+# cache reuses the compiled form on every call.
+_INSERT_REG_SQL = f"""
+    INSERT INTO registrations (
+        name, email, city, country,
+        consent, consent_ts,
+        questionnaire_completed, recommendations_viewed,
+        risk_score, risk_category,
+        created_ts, user_id
+    )
+    VALUES (?, ?, ?, ?, ?, {_NOW_SQL}, 1, ?, ?, ?, datetime('now'), NULL)
+"""
+
+_UPDATE_REG_VIEWED_SQL = """
+    UPDATE registrations
+    SET recommendations_viewed = 1
+    WHERE id = ?
+"""
+
+_INSERT_GOAL_SQL = f"""
+    INSERT INTO goals (
+        goal_id, registration_id, corpus, sip, horizon, risk_category,
+        conservative_projection, expected_projection, best_case_projection,
+        confidence, adjusted_return, created_at, updated_at, status
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_NOW_SQL}, ?)
+"""
+
+# Insert a goal straight into its final status (e.g. email already sent),
+# stamping the matching email_sent_at / revisited_at, instead of INSERT
+# followed by UPDATE. Fails on a duplicate goal_id.
+_INSERT_GOAL_STATUS_SQL = f"""
+    INSERT INTO goals (
+        goal_id, registration_id, corpus, sip, horizon, risk_category,
+        conservative_projection, expected_projection, best_case_projection,
+        confidence, adjusted_return, created_at, updated_at, status,
+        email_sent_at, revisited_at
+    )
+    VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_NOW_SQL}, ?13,
+        CASE WHEN ?13 = 'email_sent' THEN {_NOW_SQL} END,
+        CASE WHEN ?13 = 'revisited' THEN {_NOW_SQL} END
+    )
+"""
+
+# Save-or-transition for a goal_id that is already known
+_UPSERT_GOAL_SQL = _INSERT_GOAL_STATUS_SQL + """
+    ON CONFLICT(goal_id) DO UPDATE SET
+        registration_id = excluded.registration_id,
+        corpus = excluded.corpus,
+        sip = excluded.sip,
+        horizon = excluded.horizon,
+        risk_category = excluded.risk_category,
+        conservative_projection = excluded.conservative_projection,
+        expected_projection = excluded.expected_projection,
+        best_case_projection = excluded.best_case_projection,
+        confidence = excluded.confidence,
+        adjusted_return = excluded.adjusted_return,
+        updated_at = excluded.updated_at,
+        status = excluded.status,
+        email_sent_at = CASE WHEN excluded.status = 'email_sent'
+                             THEN excluded.updated_at ELSE email_sent_at END,
+        revisited_at = CASE WHEN excluded.status = 'revisited'
+                            THEN excluded.updated_at ELSE revisited_at END
+"""
+
 
 # ===================================================================
 # DATABASE CONNECTION
@@ -32,14 +250,101 @@ def get_db_path() -> str:
 
 
 def get_connection() -> sqlite3.Connection:
-    """Create a new SQLite connection with Row factory."""
-    db_path = Path(get_db_path())
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    """
+    Return this thread's SQLite connection, opening it on first use.
+
+    The connection is configured once (Row factory, WAL journal and
+    tuned PRAGMAs) and then reused, so callers must not close it. If
+    ROBO_DB_PATH changes, the old connection is closed and a new one is
+    opened.
+
+    ROBO_DB_PATH=":memory:" skips WAL (and gives each thread its own
+    private database, which is only useful for tests). WAL lets readers
+    run alongside the single writer; under heavy write contention
+    writers still queue on _write_lock, which is fine for one app node.
+    """
+    db_path = get_db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        if _local.path == db_path:
+            return conn
+        # Release the old file handle (and its WAL/shm locks)
+        _local.conn = None
+        conn.close()
+
+    in_memory = db_path == ":memory:"
+    if in_memory:
+        uri = "file::memory:"
+    else:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=rwc"
+
+    # URI mode=rwc: read/write, create if missing. Autocommit
+    # (isolation_level=None) so reads never hold a transaction open and
+    # writers take the lock up front via _write_transaction(). Shared
+    # cache is deliberately not used: it swaps WAL's concurrent readers
+    # for table-level locks.
+    conn = sqlite3.connect(
+        uri,
+        uri=True,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
+    if not in_memory:
+        conn.execute(_WAL_PRAGMA)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+    _local.conn = conn
+    _local.path = db_path
     return conn
 
 
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """
+    Run a block as one write transaction on conn.
+    
+    Serialises writers in this process and opens the transaction with
+    BEGIN IMMEDIATE, so the write lock is taken before any reads and the
+    commit cannot fail with SQLITE_BUSY on lock upgrade. Rolls back if
+    the block raises.
+    """
+    with _write_lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+def _migrate_goals_without_rowid(cur: sqlite3.Cursor) -> None:
+    """
+    One-time migration of a legacy goals table (AUTOINCREMENT id plus a
+    UNIQUE goal_id) to the WITHOUT ROWID layout keyed by goal_id.
+    """
+    columns = [r["name"] for r in cur.execute("PRAGMA table_info(goals)")]
+    if "id" not in columns:
+        return
+    
+    cols = ", ".join(c for c in columns if c != "id")
+    cur.execute(_GOALS_TABLE_SQL.format(table="goals_new"))
+    cur.execute(f"INSERT INTO goals_new ({cols}) SELECT {cols} FROM goals")
+    cur.execute("DROP TABLE goals")
+    cur.execute("ALTER TABLE goals_new RENAME TO goals")
+
+
+def _analyze(table: str) -> None:
+    """Refresh planner statistics for a table after a large bulk load."""
+    conn = get_connection()
+    with _write_transaction(conn):
+        conn.execute(f"ANALYZE {table}")
+
+
 # ===================================================================
 # DATABASE INITIALIZATION (Combined: Registrations + Goals)
 # ===================================================================
@@ -52,85 +357,29 @@ def init_db() -> None:
     - registrations table (Phase 2)
     - goals table (Phase 3 Iteration 2)
     
+    Returns immediately when PRAGMA user_version already equals
+    SCHEMA_VERSION; otherwise migrates a legacy goals table and applies
+    _SCHEMA_SQL in one executescript() transaction.
+    
     Implements:
     - SRS Section 5: Data model
     - Phase 3 Goal Path persistence
     """
     conn = get_connection()
-    cur = conn.cursor()
     
-    # =========================================================
-    # REGISTRATIONS TABLE (Phase 2 - Existing)
-    # =========================================================
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS registrations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            email TEXT NOT NULL,
-            city TEXT,
-            country TEXT,
-            consent INTEGER NOT NULL,
-            consent_ts TEXT NOT NULL,
-            questionnaire_completed INTEGER NOT NULL DEFAULT 1,
-            recommendations_viewed INTEGER NOT NULL DEFAULT 0,
-            risk_score INTEGER,
-            risk_category TEXT,
-            created_ts TEXT NOT NULL DEFAULT (datetime('now')),
-            user_id TEXT
-        )
-        """
-    )
+    if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        return
     
-    # Indexes as per SRS (email, country)
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_reg_email ON registrations(email)"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_reg_country ON registrations(country)"
-    )
+    with _write_transaction(conn):
+        _migrate_goals_without_rowid(conn.cursor())
     
-    # =========================================================
-    # GOALS TABLE (Phase 3 Iteration 2 - New)
-    # =========================================================
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS goals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_id TEXT UNIQUE NOT NULL,
-            registration_id INTEGER,
-            corpus REAL NOT NULL,
-            sip REAL NOT NULL,
-            horizon INTEGER NOT NULL,
-            risk_category TEXT NOT NULL,
-            conservative_projection REAL,
-            expected_projection REAL,
-            best_case_projection REAL,
-            confidence TEXT,
-            adjusted_return REAL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            status TEXT DEFAULT 'saved',
-            email_sent_at TEXT,
-            revisited_at TEXT,
-            FOREIGN KEY (registration_id) REFERENCES registrations(id)
-        )
-        """
-    )
-    
-    # Indexes for goals table
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_goal_id ON goals(goal_id)"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_goal_reg_id ON goals(registration_id)"
-    )
-    cur.execute(
-        "CREATE INDEX IF NOT EXISTS idx_goal_status ON goals(status)"
-    )
-    
-    conn.commit()
-    conn.close()
+    with _write_lock:
+        try:
+            conn.executescript(_SCHEMA_SQL)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
 
 # ===================================================================
@@ -146,53 +395,96 @@ def save_registration(
     consent: bool,
     risk_score: Optional[int],
     risk_category: Optional[str],
+    recommendations_viewed: bool = False,
 ) -> Optional[int]:
     """
     Insert a new registration row.
     
+    Pass recommendations_viewed=True when the caller already knows the
+    recommendations page will be shown, to skip a separate UPDATE.
+    
     Traceability:
     - FR-R1.3: Persist record with flags
     - FR-R4.1: Record questionnaire_completed, registered (implicit), recommendations_viewed
     - FR-R5.1: Record consent and timestamp
     """
-    conn = get_connection()
-    cur = conn.cursor()
+    reg_ids = save_registrations_bulk(
+        [
+            {
+                "name": name,
+                "email": email,
+                "city": city,
+                "country": country,
+                "consent": consent,
+                "risk_score": risk_score,
+                "risk_category": risk_category,
+                "recommendations_viewed": recommendations_viewed,
+            }
+        ]
+    )
+    return reg_ids[0]
+
+
+def save_registrations_bulk(regs: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many registration rows in a single transaction.
     
-    consent_ts = datetime.utcnow().isoformat(timespec="seconds")
+    Args:
+        regs: Dicts with the same keys as save_registration's arguments
+        
+    Returns:
+        Row IDs of the inserted registrations, in input order
     
-    cur.execute(
-        """
-        INSERT INTO registrations (
-            name, email, city, country,
-            consent, consent_ts,
-            questionnaire_completed, recommendations_viewed,
-            risk_score, risk_category,
-            created_ts, user_id
-        )
-        VALUES (?, ?, ?, ?, ?, ?, 1, 0, ?, ?, datetime('now'), NULL)
-        """,
-        (
-            name or None,
-            email.strip(),
-            city or None,
-            country or None,
-            1 if consent else 0,
-            consent_ts,
-            risk_score,
-            risk_category,
-        ),
-    )
+    Note:
+        executemany binds each row separately, so SQLite's bound-parameter
+        limit (SQLITE_MAX_VARIABLE_NUMBER) does not cap the batch size.
+    """
+    if not regs:
+        return []
     
-    reg_id = cur.lastrowid
-    conn.commit()
-    conn.close()
+    conn = get_connection()
+    cur = conn.cursor()
     
-    return reg_id
+    rows = [
+        (
+            r.get("name") or None,
+            r["email"].strip(),
+            r.get("city") or None,
+            r.get("country") or None,
+            1 if r.get("consent") else 0,
+            1 if r.get("recommendations_viewed") else 0,
+            r.get("risk_score"),
+            r.get("risk_category"),
+        )
+        for r in regs
+    ]
+    
+    with _write_transaction(conn):
+        if len(rows) == 1 and _HAS_RETURNING:
+            cur.execute(_INSERT_REG_SQL + " RETURNING id", rows[0])
+            ids = [cur.fetchone()[0]]
+        else:
+            cur.executemany(_INSERT_REG_SQL, rows)
+            # AUTOINCREMENT ids are contiguous within one locked transaction
+            last_id = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+            ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    _bump_reg_write_version()
+    
+    if len(rows) >= _ANALYZE_MIN_ROWS:
+        _analyze("registrations")
+    
+    return ids
 
 
-def mark_recommendations_viewed(registration_id: int) -> None:
+def mark_recommendations_viewed(
+    registration_id: Union[int, Iterable[int]],
+) -> None:
     """
-    Set recommendations_viewed flag for a registration.
+    Set recommendations_viewed flag for one or more registrations.
+    
+    Args:
+        registration_id: A registration ID, or an iterable of IDs to
+                         update in a single transaction
     
     Traceability:
     - FR-R1.3: recommendations_viewed = true when recommendations page loads
@@ -201,21 +493,44 @@ def mark_recommendations_viewed(registration_id: int) -> None:
     conn = get_connection()
     cur = conn.cursor()
     
-    cur.execute(
-        """
-        UPDATE registrations
-        SET recommendations_viewed = 1
-        WHERE id = ?
-        """,
-        (registration_id,),
-    )
+    if isinstance(registration_id, int):
+        params = [(registration_id,)]
+    else:
+        params = [(reg_id,) for reg_id in registration_id]
     
-    conn.commit()
-    conn.close()
+    with _write_transaction(conn):
+        cur.executemany(_UPDATE_REG_VIEWED_SQL, params)
+    _bump_reg_write_version()
+
+
+def _bump_reg_write_version() -> None:
+    """Invalidate cached registration reads (call after commit)."""
+    global _reg_write_version
+    _reg_write_version += 1
+
+
+def get_registrations_version() -> int:
+    """
+    Return the registrations write counter for this process.
+    
+    Callers can key their own caches on it; it changes after every
+    committed registrations write.
+    """
+    return _reg_write_version
 
 
 def fetch_latest_registrations(limit: int = 50) -> List[sqlite3.Row]:
-    """Return latest N registrations for admin view. (FR-R3.1, FR-R4.2)"""
+    """
+    Return latest N registrations for admin view. (FR-R3.1, FR-R4.2)
+    
+    Results are cached until the next registrations write in this
+    process, so admin page reruns skip the query.
+    """
+    key = (get_db_path(), limit, _reg_write_version)
+    cached = _latest_regs_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    
     conn = get_connection()
     cur = conn.cursor()
     
@@ -234,9 +549,11 @@ def fetch_latest_registrations(limit: int = 50) -> List[sqlite3.Row]:
     )
     
     rows = cur.fetchall()
-    conn.close()
     
-    return rows
+    _latest_regs_cache.clear()
+    _latest_regs_cache[key] = rows
+    
+    return list(rows)
 
 
 def get_overview_metrics() -> Dict[str, Any]:
@@ -250,21 +567,23 @@ def get_overview_metrics() -> Dict[str, Any]:
     conn = get_connection()
     cur = conn.cursor()
     
-    # Total registered (distinct email)
-    cur.execute("SELECT COUNT(DISTINCT email) AS c FROM registrations")
-    total_registered = cur.fetchone()["c"]
-    
-    # Questionnaire completions
+    # Registered / questionnaire / recommendations totals in one scan.
+    # Every row is inserted with questionnaire_completed = 1 (the form is
+    # only submitted after the questionnaire), so "completed" is simply
+    # the row count. Reinstate a filter if that ever changes.
     cur.execute(
-        "SELECT COUNT(*) AS c FROM registrations WHERE questionnaire_completed = 1"
-    )
-    total_questionnaire_completed = cur.fetchone()["c"]
-    
-    # Recommendations viewed
-    cur.execute(
-        "SELECT COUNT(*) AS c FROM registrations WHERE recommendations_viewed = 1"
+        """
+        SELECT
+            COUNT(DISTINCT email) AS total_registered,
+            COUNT(*) AS total_completed,
+            COALESCE(SUM(recommendations_viewed = 1), 0) AS total_viewed
+        FROM registrations
+        """
     )
-    total_recommendations_viewed = cur.fetchone()["c"]
+    totals = cur.fetchone()
+    total_registered = totals["total_registered"]
+    total_questionnaire_completed = totals["total_completed"]
+    total_recommendations_viewed = totals["total_viewed"]
     
     # Breakdown by country
     cur.execute(
@@ -303,7 +622,6 @@ def get_overview_metrics() -> Dict[str, Any]:
         ),
     }
     
-    conn.close()
     
     return {
         "total_registered": total_registered,
@@ -315,78 +633,65 @@ def get_overview_metrics() -> Dict[str, Any]:
     }
 
 
-def export_registrations_csv() -> str:
+def export_registrations_csv_iter(
+    chunk: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
     """
-    Export full registrations table as CSV string.
+    Yield the registrations CSV as text chunks: the header, then one
+    chunk per ``chunk`` rows fetched from the cursor.
     
-    Traceability:
-    - FR-R3.2, FR-R3.3: Admin CSV export
-    - FR-R4.3: Export aggregated counts
-    """
-    import csv
-    from io import StringIO
+    Peak memory is O(chunk) regardless of table size.
     
+    Args:
+        chunk: Rows fetched and formatted per yielded chunk
+    """
     conn = get_connection()
     cur = conn.cursor()
+    cur.arraysize = chunk
     
-    cur.execute(
-        """
-        SELECT id, name, email, city, country,
-            consent, consent_ts,
-            questionnaire_completed, recommendations_viewed,
-            risk_score, risk_category,
-            created_ts, user_id
-        FROM registrations
-        ORDER BY created_ts DESC
-        """
-    )
+    cur.execute(_EXPORT_REG_SQL)
     
-    rows = cur.fetchall()
-    conn.close()
+    buf = StringIO()
+    writer = csv.writer(buf)
     
-    output = StringIO()
-    writer = csv.writer(output)
+    # Header (generated from the same column tuple as the SELECT)
+    writer.writerow(_REG_EXPORT_COLUMNS)
     
-    # Header
-    writer.writerow(
-        [
-            "id",
-            "name",
-            "email",
-            "city",
-            "country",
-            "consent",
-            "consent_ts",
-            "questionnaire_completed",
-            "recommendations_viewed",
-            "risk_score",
-            "risk_category",
-            "created_ts",
-            "user_id",
-        ]
-    )
+    # Rows are positional tuples in header order: no per-column lookups
+    while rows := cur.fetchmany():
+        writer.writerows(rows)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
     
-    # Rows
-    for r in rows:
-        writer.writerow(
-            [
-                r["id"],
-                r["name"],
-                r["email"],
-                r["city"],
-                r["country"],
-                r["consent"],
-                r["consent_ts"],
-                r["questionnaire_completed"],
-                r["recommendations_viewed"],
-                r["risk_score"],
-                r["risk_category"],
-                r["created_ts"],
-                r["user_id"],
-            ]
-        )
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def export_registrations_csv(out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Export full registrations table as CSV.
     
-    return output.getvalue()
+    Built on export_registrations_csv_iter(), so rows are streamed from
+    the cursor in batches of EXPORT_BATCH_SIZE.
+    
+    Args:
+        out: Optional text file-like object to write into. If omitted,
+             the CSV is collected and returned as a string.
+    
+    Returns:
+        CSV string when ``out`` is None, otherwise None
+    
+    Traceability:
+    - FR-R3.2, FR-R3.3: Admin CSV export
+    - FR-R4.3: Export aggregated counts
+    """
+    chunks = export_registrations_csv_iter()
+    if out is None:
+        return "".join(chunks)
+    
+    out.writelines(chunks)
+    return None
 
 
 # ===================================================================
@@ -406,9 +711,13 @@ def save_goal(
     confidence: str,
     adjusted_return: float,
     created_at: str,
+    status: str = "saved",
 ) -> str:
     """
-    Save a goal to the database.
+    Save a new goal to the database.
+    
+    Never overwrites: a goal_id that already exists raises
+    sqlite3.IntegrityError, so callers can retry with a fresh ID.
     
     Args:
         goal_id: Unique goal ID (e.g., "GOAL_20251208_ABC123")
@@ -423,44 +732,146 @@ def save_goal(
         confidence: Confidence level (High/Medium/Low)
         adjusted_return: Return after mean reversion (%)
         created_at: ISO format timestamp
+        status: Initial status ('saved', 'email_sent' or 'revisited')
         
     Returns:
         goal_id (str)
+        
+    Raises:
+        sqlite3.IntegrityError: If goal_id already exists
     """
     conn = get_connection()
-    cur = conn.cursor()
     
-    now = datetime.utcnow().isoformat(timespec="seconds")
+    row = (
+        goal_id,
+        registration_id,
+        corpus,
+        sip,
+        horizon,
+        risk_category,
+        conservative_projection,
+        expected_projection,
+        best_case_projection,
+        confidence,
+        adjusted_return,
+        created_at,
+        status,
+    )
     
-    cur.execute(
-        """
-        INSERT INTO goals (
-            goal_id, registration_id, corpus, sip, horizon, risk_category,
-            conservative_projection, expected_projection, best_case_projection,
-            confidence, adjusted_return, created_at, updated_at, status
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+    with _write_transaction(conn):
+        conn.execute(_INSERT_GOAL_STATUS_SQL, row)
+    _get_goal_cached.cache_clear()
+    
+    return goal_id
+
+
+def save_goals_bulk(goals: List[Dict[str, Any]]) -> int:
+    """
+    Save many goals in a single transaction (e.g., admin imports).
+    
+    Args:
+        goals: Dicts with the same keys as save_goal's arguments
+        
+    Returns:
+        Number of goals inserted
+    """
+    if not goals:
+        return 0
+    
+    conn = get_connection()
+    cur = conn.cursor()
+    
+    rows = [
         (
-            goal_id,
-            registration_id,
-            corpus,
-            sip,
-            horizon,
-            risk_category,
-            conservative_projection,
-            expected_projection,
-            best_case_projection,
-            confidence,
-            adjusted_return,
-            created_at,
-            now,
+            g["goal_id"],
+            g.get("registration_id"),
+            g["corpus"],
+            g["sip"],
+            g["horizon"],
+            g["risk_category"],
+            g["conservative_projection"],
+            g["expected_projection"],
+            g["best_case_projection"],
+            g["confidence"],
+            g["adjusted_return"],
+            g["created_at"],
             "saved",
-        ),
+        )
+        for g in goals
+    ]
+    
+    with _write_transaction(conn):
+        cur.executemany(_INSERT_GOAL_SQL, rows)
+    _get_goal_cached.cache_clear()
+    
+    if len(rows) >= _ANALYZE_MIN_ROWS:
+        _analyze("goals")
+    
+    return len(rows)
+
+
+def save_or_update_goal(
+    goal_id: str,
+    registration_id: Optional[int],
+    corpus: float,
+    sip: float,
+    horizon: int,
+    risk_category: str,
+    conservative_projection: float,
+    expected_projection: float,
+    best_case_projection: float,
+    confidence: str,
+    adjusted_return: float,
+    created_at: str,
+    status: str = "saved",
+) -> str:
+    """
+    Insert a goal, or update it in place if goal_id already exists.
+    
+    Replaces the save_goal + mark_goal_email_sent pair with one UPSERT, so
+    the final goal state is committed in a single transaction. The
+    matching email_sent_at / revisited_at timestamp is stamped when status
+    is 'email_sent' or 'revisited'; created_at is kept on update.
+    
+    Args:
+        goal_id: Unique goal ID
+        registration_id: FK to registrations (optional for anonymous)
+        corpus: Initial corpus (₹)
+        sip: Monthly SIP (₹)
+        horizon: Investment horizon (years)
+        risk_category: Risk category name
+        conservative_projection: Conservative projection (₹)
+        expected_projection: Expected projection (₹)
+        best_case_projection: Best case projection (₹)
+        confidence: Confidence level (High/Medium/Low)
+        adjusted_return: Return after mean reversion (%)
+        created_at: ISO format timestamp (used on first insert only)
+        status: Goal status ('saved', 'email_sent' or 'revisited')
+        
+    Returns:
+        goal_id (str)
+    """
+    conn = get_connection()
+    
+    row = (
+        goal_id,
+        registration_id,
+        corpus,
+        sip,
+        horizon,
+        risk_category,
+        conservative_projection,
+        expected_projection,
+        best_case_projection,
+        confidence,
+        adjusted_return,
+        created_at,
+        status,
     )
     
-    conn.commit()
-    conn.close()
+    with _write_transaction(conn):
+        conn.execute(_UPSERT_GOAL_SQL, row)
+    _get_goal_cached.cache_clear()
     
     return goal_id
 
@@ -469,12 +880,21 @@ def get_goal(goal_id: str) -> Optional[Dict]:
     """
     Retrieve a goal by ID.
     
+    Reads are memoised per goal_id; every goal write clears the cache.
+    
     Args:
         goal_id: Goal ID string
         
     Returns:
         Goal dict or None if not found
     """
+    goal = _get_goal_cached(get_db_path(), goal_id)
+    return dict(goal) if goal is not None else None
+
+
+@lru_cache(maxsize=1024)
+def _get_goal_cached(db_path: str, goal_id: str) -> Optional[Dict]:
+    """Fetch a goal row as a dict (cached; keyed by DB path and goal ID)."""
     conn = get_connection()
     cur = conn.cursor()
     
@@ -483,14 +903,13 @@ def get_goal(goal_id: str) -> Optional[Dict]:
         (goal_id,),
     )
     row = cur.fetchone()
-    conn.close()
     
     if row:
         return dict(row)
     return None
 
 
-def get_user_goals(registration_id: int) -> pd.DataFrame:
+def get_user_goals(registration_id: int) -> List[Dict[str, Any]]:
     """
     Retrieve all goals for a user.
     
@@ -498,20 +917,21 @@ def get_user_goals(registration_id: int) -> pd.DataFrame:
         registration_id: User's registration ID
         
     Returns:
-        DataFrame with all user's goals ordered by creation date (newest first)
+        List of goal dicts ordered by creation date (newest first)
     """
     conn = get_connection()
+    cur = conn.cursor()
     
-    query = """
-    SELECT * FROM goals 
-    WHERE registration_id = ? 
-    ORDER BY created_at DESC
-    """
-    
-    df = pd.read_sql_query(query, conn, params=(registration_id,))
-    conn.close()
+    cur.execute(
+        """
+        SELECT * FROM goals 
+        WHERE registration_id = ? 
+        ORDER BY created_at DESC
+        """,
+        (registration_id,),
+    )
     
-    return df
+    return [dict(r) for r in cur.fetchall()]
 
 
 def mark_goal_email_sent(goal_id: str) -> None:
@@ -524,19 +944,18 @@ def mark_goal_email_sent(goal_id: str) -> None:
     conn = get_connection()
     cur = conn.cursor()
     
-    now = datetime.utcnow().isoformat(timespec="seconds")
-    
-    cur.execute(
-        """
-        UPDATE goals 
-        SET status = 'email_sent', email_sent_at = ?, updated_at = ?
-        WHERE goal_id = ?
-        """,
-        (now, now, goal_id),
-    )
-    
-    conn.commit()
-    conn.close()
+    with _write_transaction(conn):
+        cur.execute(
+            f"""
+            UPDATE goals 
+            SET status = 'email_sent',
+                email_sent_at = {_NOW_SQL},
+                updated_at = {_NOW_SQL}
+            WHERE goal_id = ?
+            """,
+            (goal_id,),
+        )
+    _get_goal_cached.cache_clear()
 
 
 def mark_goal_revisited(goal_id: str) -> None:
@@ -549,19 +968,18 @@ def mark_goal_revisited(goal_id: str) -> None:
     conn = get_connection()
     cur = conn.cursor()
     
-    now = datetime.utcnow().isoformat(timespec="seconds")
-    
-    cur.execute(
-        """
-        UPDATE goals 
-        SET status = 'revisited', revisited_at = ?, updated_at = ?
-        WHERE goal_id = ?
-        """,
-        (now, now, goal_id),
-    )
-    
-    conn.commit()
-    conn.close()
+    with _write_transaction(conn):
+        cur.execute(
+            f"""
+            UPDATE goals 
+            SET status = 'revisited',
+                revisited_at = {_NOW_SQL},
+                updated_at = {_NOW_SQL}
+            WHERE goal_id = ?
+            """,
+            (goal_id,),
+        )
+    _get_goal_cached.cache_clear()
 
 
 def get_goals_analytics() -> Dict[str, Any]:
@@ -574,9 +992,20 @@ def get_goals_analytics() -> Dict[str, Any]:
     conn = get_connection()
     cur = conn.cursor()
     
-    # Total goals
-    cur.execute("SELECT COUNT(*) AS c FROM goals")
-    total_goals = cur.fetchone()["c"]
+    # Total goals and averages in one scan
+    cur.execute(
+        """
+        SELECT 
+            COUNT(*) AS total_goals,
+            ROUND(AVG(corpus), 0) AS avg_corpus,
+            ROUND(AVG(sip), 0) AS avg_sip,
+            ROUND(AVG(horizon), 1) AS avg_horizon,
+            ROUND(AVG(expected_projection), 0) AS avg_expected
+        FROM goals
+        """
+    )
+    avg_row = cur.fetchone()
+    total_goals = avg_row["total_goals"]
     
     # By status
     cur.execute(
@@ -596,21 +1025,6 @@ def get_goals_analytics() -> Dict[str, Any]:
     )
     by_risk_category = {row["risk_category"]: row["c"] for row in cur.fetchall()}
     
-    # Average projection
-    cur.execute(
-        """
-        SELECT 
-            ROUND(AVG(corpus), 0) AS avg_corpus,
-            ROUND(AVG(sip), 0) AS avg_sip,
-            ROUND(AVG(horizon), 1) AS avg_horizon,
-            ROUND(AVG(expected_projection), 0) AS avg_expected
-        FROM goals
-        """
-    )
-    avg_row = cur.fetchone()
-    
-    conn.close()
-    
     return {
         "total_goals": total_goals,
         "by_status": by_status,
@@ -625,18 +1039,22 @@ def get_goals_analytics() -> Dict[str, Any]:
     }
 
 
-def export_goals_csv() -> str:
+def export_goals_csv(out: Optional[TextIO] = None) -> Optional[str]:
     """
     Export all goals as CSV (Admin export).
     
+    Rows are streamed from the cursor in batches of EXPORT_BATCH_SIZE.
+    
+    Args:
+        out: Optional text file-like object to write into. If omitted,
+             the CSV is collected and returned as a string.
+    
     Returns:
-        CSV string
+        CSV string when ``out`` is None, otherwise None
     """
-    import csv
-    from io import StringIO
-    
     conn = get_connection()
     cur = conn.cursor()
+    cur.arraysize = EXPORT_BATCH_SIZE
     
     cur.execute(
         """
@@ -644,16 +1062,16 @@ def export_goals_csv() -> str:
         ORDER BY created_at DESC
         """
     )
-    rows = cur.fetchall()
-    conn.close()
     
-    output = StringIO()
+    output = out if out is not None else StringIO()
     writer = csv.writer(output)
     
-    # Header
+    # Header (only written when there is at least one goal)
+    rows = cur.fetchmany()
     if rows:
         writer.writerow(rows[0].keys())
-        for r in rows:
-            writer.writerow(r)
+    while rows:
+        writer.writerows(rows)
+        rows = cur.fetchmany()
     
-    return output.getvalue()
\ No newline at end of file
+    return output.getvalue() if out is None else None
@@ -9,30 +9,144 @@ Features:
 - Data freshness indicators
 """
 
+import math
 import streamlit as st
-import pandas as pd
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timezone
 import logging
-from typing import Optional
-from modules.pdf_export import generate_goal_pdf
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from modules.persistence import save_goal
-from modules.utils_ui import navigate_to_home
+from modules.recommendations import get_recommendations
 from utils.constants import (
     BASELINE_AS_OF,
     CATEGORY_RETURNS, 
     CATEGORY_VOLATILITY, 
+    CONFIDENCE_PERCENTAGES,
+    CONFIDENCE_TABLE,
     VOLATILITY_BENCHMARKS,
     RECENT_1YR_MARKET_RETURNS,
 )
-from utils.formatting import format_currency, format_percentage
+from utils.formatting import format_currency_many, format_percentage_many
+
+# pandas is only used in annotations here (persistence and recommendations
+# import it anyway). The PDF stack (reportlab, qrcode) is imported where
+# used, so reruns that never export a PDF skip it.
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Fallbacks for unknown risk categories, resolved once at import
+_DEFAULT_RETURNS = CATEGORY_RETURNS["Medium Risk"]
+_DEFAULT_VOL = CATEGORY_VOLATILITY["Medium Risk"]
+
+# Everything a projection needs per risk category, resolved at import:
+# (conservative, expected, best_case, volatility, recent_1yr_return).
+# recent_1yr falls back to the category's own expected return, and
+# unknown categories use Medium Risk rates with no market override,
+# matching the individual lookups.
+_CAT_TABLE = {
+    category: (
+        returns["conservative"],
+        returns["expected"],
+        returns["best_case"],
+        CATEGORY_VOLATILITY.get(category, _DEFAULT_VOL),
+        RECENT_1YR_MARKET_RETURNS.get(category, returns["expected"]),
+    )
+    for category, returns in CATEGORY_RETURNS.items()
+}
+_CAT_DEFAULT = (
+    _DEFAULT_RETURNS["conservative"],
+    _DEFAULT_RETURNS["expected"],
+    _DEFAULT_RETURNS["best_case"],
+    _DEFAULT_VOL,
+    _DEFAULT_RETURNS["expected"],
+)
+
+# Session keys owned by the goal path; cleared on Home instead of
+# wiping the whole session (and every widget's state) with clear().
+_OWN_KEYS = (
+    "goal_corpus",
+    "goal_sip",
+    "goal_horizon",
+    "goal_path_disclaimer_acknowledged",
+    "goal_path_stage2_disclaimer_acknowledged",
+    "goal_id",
+    "goalid",
+)
+
+# Numba is optional: when installed, the FV kernel below is JIT-compiled
+# (and cached on disk); otherwise it runs as plain Python.
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+
+
+def _jit(signature):
+    """
+    Decorator: compile with numba.njit(signature, cache=True) if
+    available, else leave the function as plain Python.
+    
+    The explicit signature compiles eagerly at import (or loads the
+    on-disk cache) instead of on the first call.
+    """
+    def wrap(func):
+        if njit is None:
+            return func
+        return njit(signature, cache=True, fastmath=True)(func)
+    return wrap
+
 
 # ===================================================================
 # GOAL CALCULATIONS (Business Logic - Testable)
 # ===================================================================
 
+@_jit("float64(float64, float64, int64, float64)")
+def _fv(pv, pmt, n, r):
+    """FV of corpus pv plus n monthly payments pmt at monthly rate r."""
+    if n <= 0 or r == 0.0:
+        return pv + pmt * n
+    # Corpus-only goal: plain compounding, no annuity term
+    if pmt == 0.0:
+        return pv * math.exp(n * math.log1p(r))
+    # (1 + r)^n - 1 in one pass, without cancellation for small r
+    g = math.expm1(n * math.log1p(r))
+    # SIP-only goal: annuity term alone
+    if pv == 0.0:
+        return pmt * g / r
+    return pv * (g + 1.0) + pmt * g / r
+
+
+@lru_cache(maxsize=128)
+def _scenario_factors(years: int, rates: tuple) -> tuple:
+    """
+    Per-rate (growth, annuity) factors for a fixed horizon.
+
+    FV = corpus * growth + sip * annuity, where growth is _fv of a unit
+    corpus and annuity is _fv of a unit SIP, so projections share the
+    kernel (and its corpus-only / SIP-only branches) with
+    calculate_corpus_growth. Horizons and category rates come from a
+    small set, so nearly every projection is a cache hit and costs three
+    multiply-adds.
+
+    Args:
+        years: Investment duration (years)
+        rates: Annual return percentages (hashable tuple)
+
+    Returns:
+        Tuple of (growth, annuity) pairs, one per rate
+    """
+    n = int(years * 12)
+    factors = []
+    for annual_return_pct in rates:
+        r = annual_return_pct / 12 / 100
+        factors.append((_fv(1.0, 0.0, n, r), _fv(0.0, 1.0, n, r)))
+    return tuple(factors)
+
+
 def calculate_corpus_growth(
     initial_corpus: float,
     monthly_sip: float,
@@ -59,26 +173,15 @@ def calculate_corpus_growth(
     Returns:
         Final corpus (₹)
     """
-    if years <= 0:
-        return initial_corpus + (monthly_sip * 12 * years)
-    
-    if annual_return_pct == 0:
-        # No returns - just compound SIP
-        total_sip = monthly_sip * 12 * years
-        return initial_corpus + total_sip
-    
-    monthly_return_pct = annual_return_pct / 12 / 100
-    months = years * 12
-    
-    # FV of initial corpus
-    fv_corpus = initial_corpus * ((1 + monthly_return_pct) ** months)
-    
-    # FV of SIP (using FV of annuity formula)
-    fv_sip = monthly_sip * (((1 + monthly_return_pct) ** months - 1) / monthly_return_pct)
-    
-    return fv_corpus + fv_sip
+    return _fv(
+        float(initial_corpus),
+        float(monthly_sip),
+        int(years * 12),
+        annual_return_pct / 12 / 100,
+    )
 
 
+@lru_cache(maxsize=16)
 def get_category_return_assumptions(risk_category: str) -> dict:
     """
     Get return assumptions for a risk category.
@@ -89,9 +192,10 @@ def get_category_return_assumptions(risk_category: str) -> dict:
     Returns:
         dict with 'conservative', 'expected', 'best_case' keys
     """
-    return CATEGORY_RETURNS.get(risk_category, CATEGORY_RETURNS["Medium Risk"])
+    return CATEGORY_RETURNS.get(risk_category, _DEFAULT_RETURNS)
 
 
+@lru_cache(maxsize=16)
 def get_category_volatility(risk_category: str) -> float:
     """
     Get volatility for a risk category.
@@ -102,7 +206,7 @@ def get_category_volatility(risk_category: str) -> float:
     Returns:
         Volatility percentage
     """
-    return CATEGORY_VOLATILITY.get(risk_category, CATEGORY_VOLATILITY["Medium Risk"])
+    return CATEGORY_VOLATILITY.get(risk_category, _DEFAULT_VOL)
 
 
 def apply_mean_reversion(base_return: float, recent_1yr_return: float) -> float:
@@ -128,6 +232,21 @@ def apply_mean_reversion(base_return: float, recent_1yr_return: float) -> float:
     return base_return
 
 
+def apply_mean_reversion_vec(base_return: np.ndarray, recent_1yr_return: np.ndarray) -> np.ndarray:
+    """
+    Vectorised apply_mean_reversion for pricing many categories at once.
+
+    Args:
+        base_return: Long-term expected returns % (array-like)
+        recent_1yr_return: Recent 1-year actual returns % (broadcastable)
+
+    Returns:
+        Array of adjusted return percentages
+    """
+    base = np.asarray(base_return, dtype=np.float64)
+    return np.where(np.asarray(recent_1yr_return) > base + 5.0, base - 1.0, base)
+
+
 def get_confidence_score(volatility: float, fund_age_years: int) -> str:
     """
     Calculate confidence level based on volatility and fund maturity.
@@ -147,31 +266,12 @@ def get_confidence_score(volatility: float, fund_age_years: int) -> str:
     Returns:
         "High", "Medium", or "Low"
     """
-    # Volatility scoring
-    if volatility <= 5.0:
-        vol_score = 3
-    elif volatility <= 10.0:
-        vol_score = 2
-    else:
-        vol_score = 1
-    
-    # Fund age scoring
-    if fund_age_years >= 10:
-        age_score = 3
-    elif fund_age_years >= 5:
-        age_score = 2
-    else:
-        age_score = 1
-    
-    # Combined score (weighted)
-    combined = (vol_score * 0.7) + (age_score * 0.3)
+    # Branchless table lookup; each comparison adds 0/1. Written so a NaN
+    # volatility lands in the >10% bucket, as the old if/elif ladder did.
+    vol_bucket = 2 - (volatility <= 10.0) - (volatility <= 5.0)
+    age_bucket = 2 - (fund_age_years >= 5) - (fund_age_years >= 10)
     
-    if combined >= 2.5:
-        return "High"
-    elif combined >= 1.5:
-        return "Medium"
-    else:
-        return "Low"
+    return CONFIDENCE_TABLE[age_bucket * 3 + vol_bucket]
 
 
 def get_confidence_percentage(confidence_level: str) -> int:
@@ -184,20 +284,33 @@ def get_confidence_percentage(confidence_level: str) -> int:
     Returns:
         Percentage (0-100)
     """
-    mapping = {
-        "High": 70,
-        "Medium": 50,
-        "Low": 25
-    }
-    return mapping.get(confidence_level, 50)
-
+    return CONFIDENCE_PERCENTAGES.get(confidence_level, 50)
+
+
+class Projections(NamedTuple):
+    """Goal projections and the assumptions behind them."""
+    conservative: float
+    expected: float
+    best_case: float
+    conservative_return: float
+    best_case_return: float
+    adjusted_return: float
+    base_return: float
+    recent_1yr_return: float
+    confidence: str
+    confidence_percentage: int
+    volatility: float
+    mean_reversion_applied: bool
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
 def calculate_goal_projections(
     corpus: float,
     sip: float,
     horizon: int,
     risk_category: str,
     recent_1yr_return: Optional[float] = None
-) -> dict:
+) -> Projections:
 
     """
     Calculate goal projections (conservative, expected, best-case).
@@ -210,56 +323,82 @@ def calculate_goal_projections(
         recent_1yr_return: Optional recent 1-year return for mean reversion
         
     Returns:
-        dict with projections and metadata
+        Projections named tuple with projections and metadata
+    
+    Note:
+        Memoised with st.cache_data on the argument tuple, so Stage 2
+        reruns with unchanged inputs skip the calculation. The result is
+        immutable; use ._asdict() where a dict is needed. The cache key
+        covers this function's code but not utils.constants, so entries
+        expire after an hour to pick up edited return assumptions.
     """
-    assumptions = get_category_return_assumptions(risk_category)
-    base_return = assumptions["expected"]
+    # One lookup for all per-category inputs
+    (
+        conservative_return,
+        base_return,
+        best_case_return,
+        volatility,
+        market_1yr_return,
+    ) = _CAT_TABLE.get(risk_category, _CAT_DEFAULT)
 
     # Phase 3a: plug in real 1Y market data if not explicitly provided
     if recent_1yr_return is None:
-        recent_1yr_return = RECENT_1YR_MARKET_RETURNS.get(risk_category, base_return)
+        recent_1yr_return = market_1yr_return
 
     # Always apply mean reversion using a concrete 1Y value
     # Ensure recent_1yr_return is not None before passing to apply_mean_reversion
     recent_1yr_return = recent_1yr_return if recent_1yr_return is not None else base_return
     adjusted_return = apply_mean_reversion(base_return, recent_1yr_return)
     
-    # Calculate projections
-    conservative = calculate_corpus_growth(
-        corpus, sip, horizon, assumptions["conservative"]
-    )
-    expected = calculate_corpus_growth(
-        corpus, sip, horizon, adjusted_return
-    )
-    best_case = calculate_corpus_growth(
-        corpus, sip, horizon, assumptions["best_case"]
-    )
+    # All three projections from cached (horizon, rates) factors
+    corpus = float(corpus)
+    sip = float(sip)
+    conservative, expected, best_case = [
+        corpus * growth + sip * annuity
+        for growth, annuity in _scenario_factors(
+            horizon, (conservative_return, adjusted_return, best_case_return)
+        )
+    ]
     
     # Confidence scoring
-    volatility = get_category_volatility(risk_category)
     confidence = get_confidence_score(volatility, fund_age_years=10)  # Assuming mature fund
     confidence_pct = get_confidence_percentage(confidence)
     
     mean_reversion_applied = (adjusted_return != base_return)
 
-    return {
-        "conservative": conservative,
-        "expected": expected,
-        "best_case": best_case,
-        "adjusted_return": adjusted_return,
-        "base_return": base_return,
-        "confidence": confidence,
-        "confidence_percentage": confidence_pct,
-        "volatility": volatility,
-        "mean_reversion_applied": mean_reversion_applied,
-    }
+    return Projections(
+        conservative=conservative,
+        expected=expected,
+        best_case=best_case,
+        conservative_return=conservative_return,
+        best_case_return=best_case_return,
+        adjusted_return=adjusted_return,
+        base_return=base_return,
+        recent_1yr_return=recent_1yr_return,
+        confidence=confidence,
+        confidence_percentage=confidence_pct,
+        volatility=volatility,
+        mean_reversion_applied=mean_reversion_applied,
+    )
+
 
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 # ===================================================================
 # UI COMPONENTS - Stage 1
 # ===================================================================
 
+def _go_home() -> None:
+    """Drop this module's session keys and return to the home screen."""
+    for key in _OWN_KEYS:
+        st.session_state.pop(key, None)
+    st.session_state.current_step = "home"
+    st.rerun()
+
+
 def render_goal_path_stage1():
     """
     Render Goal Path Stage 1: Capture goal inputs.
@@ -274,23 +413,6 @@ def render_goal_path_stage1():
     st.title("Goal Path: Stage 1")
     st.subheader("Step 5 of 6: Define Your Investment Goal")
     
-    # CRITICAL DISCLAIMER (Non-dismissable)
-    """ ack = st.session_state.get("goal_path_disclaimer_acknowledged", False)
-    if not ack:
-        st.error(
-                "⚠️ **CRITICAL DISCLAIMER - MUST ACKNOWLEDGE**\n\n"
-                "This tool is for **informational purposes only**.\n\n"
-                "It does **NOT** constitute investment advice.\n\n"
-                "**Past performance is NO guarantee of future results**.\n\n"
-                "We are **NOT SEBI-registered investment advisors**.\n\n"
-                "Please consult a **certified financial advisor** before investing."
-            )
-        if st.checkbox("✅ I acknowledge this disclaimer and understand the risks"):
-                st.session_state.goal_path_disclaimer_acknowledged = True
-                st.rerun()
-        else:
-                st.stop() """
-    
     st.info(
         "This goal path uses historical averages for your risk category to show "
         "three possible scenarios. It is an estimate, not a guarantee."
@@ -370,7 +492,7 @@ def render_goal_path_stage1():
     
     with col2:
         if st.button("🏠 Home", width = 'stretch'):
-            navigate_to_home()
+            _go_home()
 
 
 # ===================================================================
@@ -415,18 +537,6 @@ def render_goal_path_stage2():
             st.rerun()
         return
 
-    st.markdown(
-        f"""
-        **Your Goal Summary:**
-        - Initial Corpus: {format_currency(corpus)}
-        - Monthly SIP: {format_currency(sip)}
-        - Investment Horizon: {horizon} years
-        - Risk Category: **{risk_category}**
-        """
-    )
-
-    st.markdown("---")
-
     # Calculate projections
     projections = calculate_goal_projections(
         corpus=corpus,
@@ -436,30 +546,71 @@ def render_goal_path_stage2():
         recent_1yr_return=None,  # uses RECENT_1YR_MARKET_RETURNS fallback
     )
 
+    # Scenario values as one array (reusable for charts); every displayed
+    # amount and rate is formatted in one batch per rerun
+    scenario_values = np.array(
+        [projections.conservative, projections.expected, projections.best_case],
+        dtype=np.float64,
+    )
+    (
+        corpus_str,
+        sip_str,
+        conservative_str,
+        expected_str,
+        best_case_str,
+    ) = format_currency_many([corpus, sip, *scenario_values.tolist()])
+    (
+        conservative_return_str,
+        base_return_str,
+        adjusted_return_str,
+        best_case_return_str,
+        volatility_str,
+        recent_1yr_str,
+    ) = format_percentage_many(
+        [
+            projections.conservative_return,
+            projections.base_return,
+            projections.adjusted_return,
+            projections.best_case_return,
+            projections.volatility,
+            projections.recent_1yr_return,
+        ]
+    )
+
+    st.markdown(
+        f"""
+        **Your Goal Summary:**
+        - Initial Corpus: {corpus_str}
+        - Monthly SIP: {sip_str}
+        - Investment Horizon: {horizon} years
+        - Risk Category: **{risk_category}**
+        """
+    )
+
+    st.divider()
+
     # Display projections
     st.markdown(f"### Projected Corpus After {horizon} Years")
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric(
-            "🟢 Conservative",
-            format_currency(projections["conservative"]),
-            help="Lower growth scenario",
-        )
-    with col2:
-        st.metric(
-            "🟡 Expected",
-            format_currency(projections["expected"]),
-            help="Most likely scenario (adjusted for market conditions)",
-        )
-    with col3:
-        st.metric(
-            "🔵 Best Case",
-            format_currency(projections["best_case"]),
-            help="Optimistic scenario",
-        )
+    # One container + one column row; metrics written straight into it
+    metric_cols = st.container().columns(3)
+    metric_cols[0].metric(
+        "🟢 Conservative",
+        conservative_str,
+        help="Lower growth scenario",
+    )
+    metric_cols[1].metric(
+        "🟡 Expected",
+        expected_str,
+        help="Most likely scenario (adjusted for market conditions)",
+    )
+    metric_cols[2].metric(
+        "🔵 Best Case",
+        best_case_str,
+        help="Optimistic scenario",
+    )
 
-    st.markdown("---")
+    st.divider()
 
     # Baseline date
     st.info(
@@ -467,15 +618,14 @@ def render_goal_path_stage2():
         width="stretch",
     )
 
-    st.markdown("---")
+    st.divider()
 
     # Confidence & Volatility
     st.markdown("### Projection Confidence")
 
-    confidence = projections["confidence"]
-    confidence_pct = projections["confidence_percentage"]
-    volatility = projections["volatility"]
-    adjusted_return = projections["adjusted_return"]
+    confidence = projections.confidence
+    confidence_pct = projections.confidence_percentage
+    adjusted_return = projections.adjusted_return
 
     if confidence == "High":
         badge = "🟢 **HIGH** (70% confidence)"
@@ -484,27 +634,22 @@ def render_goal_path_stage2():
     else:
         badge = "🔴 **LOW** (25% confidence)"
 
-    recent_1yr = RECENT_1YR_MARKET_RETURNS.get(
-        risk_category, projections["base_return"]
-    )
-    recent_1yr = recent_1yr if recent_1yr is not None else projections["base_return"]
-
     st.markdown(
         f"""
         **Confidence Level:** {badge}
 
         This confidence level is based on:
 
-        - **Volatility:** {format_percentage(volatility)}
+        - **Volatility:** {volatility_str}
           - Lower volatility = Higher confidence in projections
-        - **Expected (Adjusted) Return:** {format_percentage(adjusted_return)}
-          - Long-term base: {format_percentage(projections['base_return'])}
-          - Recent 1Y performance: {format_percentage(recent_1yr)}
-          - Mean reversion applied: {'Yes ✓' if projections['mean_reversion_applied'] else 'No (market normal)'}
+        - **Expected (Adjusted) Return:** {adjusted_return_str}
+          - Long-term base: {base_return_str}
+          - Recent 1Y performance: {recent_1yr_str}
+          - Mean reversion applied: {'Yes ✓' if projections.mean_reversion_applied else 'No (market normal)'}
         """
     )
 
-    st.markdown("---")
+    st.divider()
 
     # Projection breakdown (advanced view)
     with st.expander("📊 Detailed Projection Breakdown"):
@@ -512,154 +657,136 @@ def render_goal_path_stage2():
 
         st.write(
             f"""
-            **Long-term base return** for {risk_category}: {format_percentage(projections['base_return'])}
+            **Long-term base return** for {risk_category}: {base_return_str}
             - Based on historical data for your risk level.
-            - **Adjusted expected return** (final): {format_percentage(adjusted_return)}
+            - **Adjusted expected return** (final): {adjusted_return_str}
             - If the last year was unusually strong or weak, we gently adjust expectations.
             - This is called **mean reversion**—extreme returns rarely persist.
             """
         )
 
-        st.markdown("---")
+        st.divider()
 
-        breakdown_df = pd.DataFrame(
+        # Three rows of already-formatted strings: a static table needs
+        # no DataFrame or Styler
+        st.table(
             {
                 "Scenario": ["Conservative", "Expected", "Best Case"],
                 "Annual Return": [
-                    format_percentage(
-                        get_category_return_assumptions(risk_category)[
-                            "conservative"
-                        ]
-                    ),
-                    format_percentage(adjusted_return),
-                    format_percentage(
-                        get_category_return_assumptions(risk_category)["best_case"]
-                    ),
+                    conservative_return_str,
+                    adjusted_return_str,
+                    best_case_return_str,
                 ],
-                "Final Corpus": [
-                    format_currency(projections["conservative"]),
-                    format_currency(projections["expected"]),
-                    format_currency(projections["best_case"]),
-                ],
-            }
+                "Final Corpus": [conservative_str, expected_str, best_case_str],
+            },
+            hide_index=True,
         )
-        st.dataframe(breakdown_df, width="stretch", hide_index=True)
 
-    st.markdown("---")
-    st.subheader("Save & Download Your Goal")
+    st.divider()
+    st.subheader("Save, Download & Next Steps")
 
     # Ensure we have a goal_id in session (for PDF naming and future links)
     goal_id = st.session_state.get("goalid")
 
-    col_save, col_pdf = st.columns(2)
-
-    with col_save:
-        if st.button("💾 Save Goal", use_container_width=True, type="primary"):
-            try:
-                goal_data = {
-                    "registration_id": st.session_state.get("registration_id"),
-                    "corpus": corpus,
-                    "sip": sip,
-                    "horizon": horizon,
-                    "risk_category": risk_category,
-                    "conservative_projection": projections["conservative"],
-                    "expected_projection": projections["expected"],
-                    "best_case_projection": projections["best_case"],
-                    "confidence": projections["confidence"],
-                    "adjusted_return": adjusted_return,
-                    "created_at": datetime.now().isoformat(),
-                }
-
-                goal_id = save_goal(goal_data)
-                st.session_state["goalid"] = goal_id
-                st.success(f"Goal saved! Goal ID: {goal_id}")
-                st.info(
-                    "You can revisit this goal later using this ID or a shareable link (coming soon)."
-                )
-            except Exception as e:
-                st.warning(f"Could not save goal: {e}")
-                logger.error(f"Error saving goal: {e}")
-
-    with col_pdf:
-        disabled = goal_id is None
-        if st.button(
-            "📥 Generate PDF", use_container_width=True, disabled=disabled
-        ):
-            try:
-                if disabled:
-                    st.warning("Please save your goal first to generate a PDF.")
-                else:
-                    pdf_buffer = generate_goal_pdf(
-                        goal_id=goal_id,
-                        goal_name=f"{risk_category} Goal",
-                        goal_inputs={
-                            "startingcorpus": corpus,
-                            "monthlysip": sip,
-                            "horizonyears": horizon,
-                            "riskcategory": risk_category,
-                        },
-                        projections=projections,
-                        goal_url="",  # can be updated later
-                    )
-
-                    pdf_buffer.seek(0)
-                    st.download_button(
-                        label="Download Goal PDF",
-                        data=pdf_buffer,
-                        file_name=f"GoalPath_{goal_id}.pdf",
-                        mime="application/pdf",
-                    )
-            except Exception as e:
-                st.error(f"Error generating PDF: {e}")
-                logger.error(f"Error generating PDF: {e}")
-
-    st.markdown("---")
-    st.markdown("### Next Steps")
-
-    col1, col2, col3 = st.columns(3)
+    # One row for every action; save/PDF feedback renders full width below
+    save_col, pdf_col, back_col, recos_col, home_col = st.columns(5)
 
-    with col1:
-        if st.button("⬅️ Back to Stage 1", width="stretch"):
-            st.session_state.current_step = "goal_path_stage1"
-            st.rerun()
+    save_clicked = save_col.button(
+        "💾 Save Goal", use_container_width=True, type="primary"
+    )
+    disabled = goal_id is None
+    pdf_clicked = pdf_col.button(
+        "📥 Generate PDF", use_container_width=True, disabled=disabled
+    )
 
-    with col2:
-        if st.button("📋 View Recommendations", width="stretch"):
-            st.session_state.current_step = "preference_input"
-            st.rerun()
+    if back_col.button("⬅️ Back to Stage 1", width="stretch"):
+        st.session_state.current_step = "goal_path_stage1"
+        st.rerun()
+
+    if recos_col.button("📋 View Recommendations", width="stretch"):
+        st.session_state.current_step = "preference_input"
+        st.rerun()
+
+    if home_col.button("🏠 Home", width="stretch"):
+        _go_home()
+
+    if save_clicked:
+        goal_data = {
+            "registration_id": st.session_state.get("registration_id"),
+            "corpus": corpus,
+            "sip": sip,
+            "horizon": horizon,
+            "risk_category": risk_category,
+            "conservative_projection": projections.conservative,
+            "expected_projection": projections.expected,
+            "best_case_projection": projections.best_case,
+            "confidence": projections.confidence,
+            "adjusted_return": adjusted_return,
+            "created_at": _utcnow_iso(),
+        }
+        try:
+            goal_id = save_goal(goal_data)
+            st.session_state["goalid"] = goal_id
+            st.success(f"Goal saved! Goal ID: {goal_id}")
+            st.info(
+                "You can revisit this goal later using this ID or a shareable link (coming soon)."
+            )
+        except Exception as e:
+            st.warning(f"Could not save goal: {e}")
+            logger.error(f"Error saving goal: {e}")
+
+    if pdf_clicked:
+        try:
+            if disabled:
+                st.warning("Please save your goal first to generate a PDF.")
+            else:
+                from modules.pdf_export import generate_goal_pdf
+
+                pdf_buffer = generate_goal_pdf(
+                    goal_id=goal_id,
+                    goal_name=f"{risk_category} Goal",
+                    goal_inputs={
+                        "startingcorpus": corpus,
+                        "monthlysip": sip,
+                        "horizonyears": horizon,
+                        "riskcategory": risk_category,
+                    },
+                    projections=projections._asdict(),
+                    goal_url="",  # can be updated later
+                )
+
+                pdf_buffer.seek(0)
+                st.download_button(
+                    label="Download Goal PDF",
+                    data=pdf_buffer,
+                    file_name=f"GoalPath_{goal_id}.pdf",
+                    mime="application/pdf",
+                )
+        except Exception as e:
+            st.error(f"Error generating PDF: {e}")
+            logger.error(f"Error generating PDF: {e}")
 
-    with col3:
-        if st.button("🏠 Home", width="stretch"):
-            navigate_to_home()
 
 # ===================================================================
 # HELPER: Get recommended funds for goal
 # ===================================================================
 
-def get_recommended_funds_for_goal(
-    fund_df: pd.DataFrame,
-    risk_category: str,
-    sip: float
-) -> pd.DataFrame:
+def get_recommended_funds_for_goal(risk_category: str, sip: float) -> "pd.DataFrame":
     """
     Filter funds suitable for SIP-based goal investing.
+
+    Backed by get_recommendations, which loads the fund data itself and
+    caches on the scalar filter inputs.
     
     Args:
-        fund_df: Fund dataframe
         risk_category: Risk category
         sip: Monthly SIP amount
         
     Returns:
         Filtered dataframe of recommended funds
     """
-    from modules.recommendations import filter_and_sort_recommendations
-    
-    # For SIP, typically use "More than 1 year" duration
-    filtered = filter_and_sort_recommendations(
-        df=fund_df,
-        risk_category=risk_category,
-        investment_amount=sip,  # Use SIP as investment amount
-        duration="More than 1 year"  # SIP-friendly duration
-    )
+    # For SIP, typically use "More than 1 year" duration; SIP is the
+    # investment amount
+    filtered = get_recommendations(risk_category, sip, "More than 1 year")
     
     return filtered.head(5)  # Top 5 funds for goal
\ No newline at end of file
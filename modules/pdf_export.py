@@ -1,8 +1,13 @@
 # modules/pdf_export.py
 
+import copy
 import io
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from typing import Iterable
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,67 +18,51 @@ from reportlab.platypus import (
     Spacer,
     Table,
     TableStyle,
-    Image,
+    Flowable,
 )
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 
-import qrcode
-import qrcode.constants
-
 
 logger = logging.getLogger(__name__)
 
+# Table styles are immutable once built, so one instance serves every PDF
+_SUMMARY_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#208090")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 11),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("FONTSIZE", (0, 1), (-1, -1), 10),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
+    ]
+)
 
-def generate_goal_pdf(
-    goal_id: str,
-    goal_name: str,
-    goal_inputs: dict,
-    projections: dict,
-    goal_url: str | None = None,
-) -> io.BytesIO:
-    """
-    Generate a professional PDF for a goal path.
-
-    Args:
-        goal_id: Unique goal identifier (from DB)
-        goal_name: User-friendly name (e.g., "Medium Risk Goal")
-        goal_inputs: dict with keys:
-            - startingcorpus (float)
-            - monthlysip (float)
-            - horizonyears (int)
-            - riskcategory (str)
-        projections: dict from calculate_goal_projections with keys:
-            - conservative (float)
-            - expected (float)
-            - best_case (float)
-            - base_return (float)
-            - adjusted_return (float)
-            - confidence (str)
-            - confidence_percentage (int)
-            - volatility (float)
-            - mean_reversion_applied (bool)
-        goal_url: Optional URL for QR code (revisit link; can be empty for now)
+_PROJ_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#208090")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("FONTSIZE", (0, 1), (-1, -1), 9),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
+    ]
+)
 
-    Returns:
-        BytesIO object with PDF content (ready for download)
-    """
-    pdf_buffer = io.BytesIO()
 
-    doc = SimpleDocTemplate(
-        pdf_buffer,
-        pagesize=A4,
-        rightMargin=0.5 * inch,
-        leftMargin=0.5 * inch,
-        topMargin=0.5 * inch,
-        bottomMargin=0.75 * inch,
-        title=f"Goal Path - {goal_name}",
-    )
-
-    elements: list = []
+@lru_cache(maxsize=1)
+def _get_styles() -> SimpleNamespace:
+    """Build the PDF paragraph styles once; they are never mutated."""
     styles = getSampleStyleSheet()
 
-    # ----- Custom styles -----
     title_style = ParagraphStyle(
         "CustomTitle",
         parent=styles["Heading1"],
@@ -112,60 +101,115 @@ def generate_goal_pdf(
         fontName="Helvetica",
     )
 
-    # ----- Title -----
-    elements.append(Paragraph("📊 Your Investment Goal Path", title_style))
-    elements.append(Spacer(1, 0.15 * inch))
+    return SimpleNamespace(
+        title=title_style,
+        heading=heading_style,
+        normal=normal_style,
+        disclaimer=disclaimer_style,
+    )
 
-    created_date = datetime.now().strftime("%B %d, %Y")
-    elements.append(Paragraph(f"Goal: {goal_name}", normal_style))
-    elements.append(Paragraph(f"Goal ID: {goal_id}", normal_style))
-    elements.append(Paragraph(f"Created: {created_date}", normal_style))
-    elements.append(Spacer(1, 0.15 * inch))
 
-    # ----- Goal Summary -----
-    elements.append(Paragraph("Your Investment Plan", heading_style))
+# Table cell formatters (bound str.format, built once)
+_INR = "₹{:,.0f}".format
+_PCT = "{:.1f}%".format
+
+# Constant markup shared by every goal PDF
+_CONFIDENCE_NOTE_TEXT = (
+    "🔍 <b>Note:</b> The confidence percentage applies to the "
+    "<b>Expected (most likely)</b> scenario."
+)
+
+_DISCLAIMER_TEXT = (
+    "⚠️ IMPORTANT DISCLAIMER<br/><br/>"
+    "This tool is for educational and informational purposes only. "
+    "It does NOT constitute investment advice.<br/><br/>"
+    "Past performance is NO guarantee of future results. "
+    "We are NOT SEBI-registered investment advisors.<br/><br/>"
+    "Market conditions change, and actual returns may vary significantly from projections. "
+    "Please consult a certified financial advisor before making any investment decisions."
+)
+
+
+@lru_cache(maxsize=32)
+def _parsed_paragraph(text: str, style: ParagraphStyle) -> tuple:
+    """Parse constant paragraph markup once; returns (style, frags)."""
+    para = Paragraph(text, style)
+    return para.style, tuple(para.frags)
+
+
+def _static_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """
+    Paragraph for constant markup without re-parsing it.
+
+    Flowables hold layout state once wrapped, so each document gets its
+    own Paragraph built from copies of the cached fragments.
+    """
+    parsed_style, frags = _parsed_paragraph(text, style)
+    return Paragraph(text, parsed_style, frags=[copy.copy(f) for f in frags])
+
+
+_REQUIRED_INPUT_KEYS = ("startingcorpus", "monthlysip", "horizonyears", "riskcategory")
+_REQUIRED_PROJECTION_KEYS = (
+    "conservative",
+    "expected",
+    "best_case",
+    "base_return",
+    "adjusted_return",
+    "confidence_percentage",
+    "volatility",
+)
+
 
-    horizon_years = goal_inputs.get("horizonyears", 0)
-    goal_summary = [
+def _validate(goal_inputs: dict, projections: dict) -> None:
+    """
+    Check up front that the PDF inputs carry every required key.
+
+    Raises:
+        KeyError: naming the missing keys, instead of rendering 0 values
+    """
+    missing = [k for k in _REQUIRED_INPUT_KEYS if k not in goal_inputs]
+    missing += [k for k in _REQUIRED_PROJECTION_KEYS if k not in projections]
+    if missing:
+        raise KeyError(f"Missing PDF fields: {', '.join(missing)}")
+
+
+def _build_summary_rows(goal_inputs: dict) -> list[list[str]]:
+    """
+    Build the "Your Investment Plan" table rows.
+
+    Args:
+        goal_inputs: Validated goal inputs (see generate_goal_pdf)
+
+    Returns:
+        Header row followed by one [parameter, value] row per input
+    """
+    return [
         ["Parameter", "Value"],
-        ["Starting Corpus", f"₹{goal_inputs.get('startingcorpus', 0):,.0f}"],
-        ["Monthly SIP", f"₹{goal_inputs.get('monthlysip', 0):,.0f}"],
-        ["Investment Horizon", f"{horizon_years} years"],
-        ["Risk Category", goal_inputs.get("riskcategory", "N/A")],
+        ["Starting Corpus", _INR(goal_inputs["startingcorpus"])],
+        ["Monthly SIP", _INR(goal_inputs["monthlysip"])],
+        ["Investment Horizon", f"{goal_inputs['horizonyears']} years"],
+        ["Risk Category", goal_inputs["riskcategory"]],
     ]
 
-    summary_table = Table(goal_summary, colWidths=[2.5 * inch, 2.5 * inch])
-    summary_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#208090")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ("FONTSIZE", (0, 1), (-1, -1), 10),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
-            ]
-        )
-    )
-    elements.append(summary_table)
-    elements.append(Spacer(1, 0.2 * inch))
 
-    # ----- Projections -----
-    elements.append(Paragraph("Your Projection Scenarios", heading_style))
+def _build_proj_rows(projections: dict, horizon_years: int) -> list[list[str]]:
+    """
+    Build the projection scenario table rows.
+
+    Args:
+        projections: Validated projections (see generate_goal_pdf)
+        horizon_years: Investment horizon shown in the corpus header
 
-    base_return = projections.get("base_return", 0.0)
-    adjusted_return = projections.get("adjusted_return", 0.0)
-    confidence_pct = projections.get("confidence_percentage", 50)
+    Returns:
+        Header row followed by conservative, expected and best-case rows
+    """
+    base_return = projections["base_return"]
 
     # For conservative / best-case annual returns, you can adjust this later if needed
     conservative_return = max(base_return - 2.0, 0.0)
     best_case_return = base_return + 2.0
 
-    proj_data = [
+    return [
         [
             "Scenario",
             "Annual Return",
@@ -174,147 +218,276 @@ def generate_goal_pdf(
         ],
         [
             "Conservative",
-            f"{conservative_return:.1f}%",
-            f"₹{projections.get('conservative', 0):,.0f}",
+            _PCT(conservative_return),
+            _INR(projections["conservative"]),
             "—",
         ],
         [
             "Expected (Most Likely)",
-            f"{adjusted_return:.1f}%",
-            f"₹{projections.get('expected', 0):,.0f}",
-            f"{confidence_pct}%",
+            _PCT(projections["adjusted_return"]),
+            _INR(projections["expected"]),
+            f"{projections['confidence_percentage']}%",
         ],
         [
             "Best Case",
-            f"{best_case_return:.1f}%",
-            f"₹{projections.get('best_case', 0):,.0f}",
+            _PCT(best_case_return),
+            _INR(projections["best_case"]),
             "—",
         ],
     ]
 
-    proj_table = Table(
-        proj_data,
-        colWidths=[1.5 * inch, 1.3 * inch, 1.9 * inch, 1.1 * inch],
-    )
-    proj_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#208090")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ("FONTSIZE", (0, 1), (-1, -1), 9),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
-            ]
-        )
+
+def generate_goal_pdf(
+    goal_id: str,
+    goal_name: str,
+    goal_inputs: dict,
+    projections: dict,
+    goal_url: str | None = None,
+) -> io.BytesIO:
+    """
+    Generate a professional PDF for a goal path.
+
+    Args:
+        goal_id: Unique goal identifier (from DB)
+        goal_name: User-friendly name (e.g., "Medium Risk Goal")
+        goal_inputs: dict with keys:
+            - startingcorpus (float)
+            - monthlysip (float)
+            - horizonyears (int)
+            - riskcategory (str)
+        projections: dict from calculate_goal_projections with keys:
+            - conservative (float)
+            - expected (float)
+            - best_case (float)
+            - base_return (float)
+            - adjusted_return (float)
+            - confidence (str)
+            - confidence_percentage (int)
+            - volatility (float)
+            - mean_reversion_applied (bool)
+        goal_url: Optional URL for QR code (revisit link; can be empty for now)
+
+    Returns:
+        BytesIO object with PDF content (ready for download)
+
+    Raises:
+        KeyError: If a required goal input or projection key is missing
+    """
+    gi = goal_inputs
+    p = projections
+    _validate(gi, p)
+
+    pdf_buffer = io.BytesIO()
+
+    doc = SimpleDocTemplate(
+        pdf_buffer,
+        pagesize=A4,
+        rightMargin=0.5 * inch,
+        leftMargin=0.5 * inch,
+        topMargin=0.5 * inch,
+        bottomMargin=0.75 * inch,
+        title=f"Goal Path - {goal_name}",
     )
 
-    elements.append(proj_table)
-    elements.append(Spacer(1, 0.2 * inch))
+    styles = _get_styles()
+    title_style = styles.title
+    heading_style = styles.heading
+    normal_style = styles.normal
+    disclaimer_style = styles.disclaimer
 
-    # ----- Assumptions / Mean Reversion -----
-    elements.append(Paragraph("How We Calculated This", heading_style))
+    created_date = datetime.now().strftime("%B %d, %Y")
+    horizon_years = gi["horizonyears"]
 
-    mean_reversion_text = "Yes ✓" if projections.get("mean_reversion_applied") else "No"
-    volatility = projections.get("volatility", 0.0)
+    summary_table = Table(_build_summary_rows(gi), colWidths=[2.5 * inch, 2.5 * inch])
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
 
+    proj_table = Table(
+        _build_proj_rows(p, horizon_years),
+        colWidths=[1.5 * inch, 1.3 * inch, 1.9 * inch, 1.1 * inch],
+    )
+    proj_table.setStyle(_PROJ_TABLE_STYLE)
+
+    mean_reversion_text = "Yes ✓" if p.get("mean_reversion_applied", False) else "No"
     assumptions_text = (
-        f"Base Return (long-term historical average): {base_return:.1f}%<br/>"
-        f"Adjusted Return (after mean reversion): {adjusted_return:.1f}%<br/>"
+        f"Base Return (long-term historical average): {p['base_return']:.1f}%<br/>"
+        f"Adjusted Return (after mean reversion): {p['adjusted_return']:.1f}%<br/>"
         f"Mean Reversion Applied: {mean_reversion_text}<br/>"
-        f"Volatility: {volatility:.1f}%<br/><br/>"
+        f"Volatility: {p['volatility']:.1f}%<br/><br/>"
         "These projections are based on historical averages for your risk category. "
         "They are reviewed periodically and updated based on current market conditions."
     )
-    elements.append(Paragraph(assumptions_text, normal_style))
-    # After proj_table
-    elements.append(Spacer(1, 0.1 * inch))
-    elements.append(
-        Paragraph(
-            "🔍 <b>Note:</b> The confidence percentage applies to the "
-            "<b>Expected (most likely)</b> scenario.",
-            normal_style,
-        )
-    )
-    elements.append(Spacer(1, 0.2 * inch))
 
     # ----- QR Code (optional) -----
+    qr_section: list = []
     if goal_url:
-        elements.append(Paragraph("Share or Revisit This Goal", heading_style))
+        qr_section.append(_static_paragraph("Share or Revisit This Goal", heading_style))
         qr_image = generate_qr_code(goal_url)
         if qr_image is not None:
-            elements.append(Spacer(1, 0.1 * inch))
-            elements.append(qr_image)
-            elements.append(Spacer(1, 0.15 * inch))
-
-    # ----- Disclaimer -----
-    disclaimer_text = (
-        "⚠️ IMPORTANT DISCLAIMER<br/><br/>"
-        "This tool is for educational and informational purposes only. "
-        "It does NOT constitute investment advice.<br/><br/>"
-        "Past performance is NO guarantee of future results. "
-        "We are NOT SEBI-registered investment advisors.<br/><br/>"
-        "Market conditions change, and actual returns may vary significantly from projections. "
-        "Please consult a certified financial advisor before making any investment decisions."
-    )
-    elements.append(Spacer(1, 0.15 * inch))
-    elements.append(Paragraph(disclaimer_text, disclaimer_style))
+            qr_section += [Spacer(1, 0.1 * inch), qr_image, Spacer(1, 0.15 * inch)]
+
+    elements = [
+        # ----- Title -----
+        _static_paragraph("📊 Your Investment Goal Path", title_style),
+        Spacer(1, 0.15 * inch),
+        Paragraph(f"Goal: {goal_name}", normal_style),
+        Paragraph(f"Goal ID: {goal_id}", normal_style),
+        Paragraph(f"Created: {created_date}", normal_style),
+        Spacer(1, 0.15 * inch),
+        # ----- Goal Summary -----
+        _static_paragraph("Your Investment Plan", heading_style),
+        summary_table,
+        Spacer(1, 0.2 * inch),
+        # ----- Projections -----
+        _static_paragraph("Your Projection Scenarios", heading_style),
+        proj_table,
+        Spacer(1, 0.2 * inch),
+        # ----- Assumptions / Mean Reversion -----
+        _static_paragraph("How We Calculated This", heading_style),
+        Paragraph(assumptions_text, normal_style),
+        Spacer(1, 0.1 * inch),
+        _static_paragraph(_CONFIDENCE_NOTE_TEXT, normal_style),
+        Spacer(1, 0.2 * inch),
+        *qr_section,
+        # ----- Disclaimer -----
+        Spacer(1, 0.15 * inch),
+        _static_paragraph(_DISCLAIMER_TEXT, disclaimer_style),
+    ]
 
     # Build PDF
-    doc.build(elements, onFirstPage=add_footer, onLaterPages=add_footer)
+    # One footer timestamp per document, bound for every page
+    footer = partial(add_footer, footer_text=_footer_text())
+    doc.build(elements, onFirstPage=footer, onLaterPages=footer)
     pdf_buffer.seek(0)
     logger.info("Generated PDF for goal %s", goal_id)
     return pdf_buffer
 
 
+def _generate_goal_pdf_from_args(args: tuple) -> io.BytesIO:
+    """generate_goal_pdf over one argument tuple (picklable pool target)."""
+    return generate_goal_pdf(*args)
+
 
-def generate_qr_code(url: str) -> Image | None:
+def generate_goal_pdfs(
+    goals: Iterable[tuple],
+    max_workers: int | None = None,
+) -> list[io.BytesIO]:
     """
-    Generate QR code image from URL.
+    Generate PDFs for several goals.
+
+    Every document reuses the module-level styles, table styles and
+    parsed boilerplate, so only per-goal content is built. PDF layout
+    is CPU-bound and holds the GIL; pass max_workers > 1 to spread the
+    batch over a process pool instead.
+
+    Args:
+        goals: (goal_id, goal_name, goal_inputs, projections, goal_url)
+            tuples, as accepted by generate_goal_pdf
+        max_workers: Process pool size; None or 1 builds serially
+
+    Returns:
+        List of BytesIO PDFs, in the same order as goals
+    """
+    goals = list(goals)
+    if max_workers and max_workers > 1 and len(goals) > 1:
+        chunksize = max(1, len(goals) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_generate_goal_pdf_from_args, goals, chunksize=chunksize))
+    return [generate_goal_pdf(*goal) for goal in goals]
+
+
+@lru_cache(maxsize=128)
+def _qr_matrix(url: str) -> tuple[tuple[bool, ...], ...]:
+    """
+    Build the QR module matrix for a URL, border included (cached per URL).
+
+    qrcode is imported here, on first use: only PDFs with a share link
+    need it.
+    """
+    import qrcode
+    import qrcode.constants
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        border=2,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    return tuple(tuple(row) for row in qr.get_matrix())
+
+
+class QRFlowable(Flowable):
+    """
+    QR code drawn as vector rectangles straight from its module matrix.
+
+    Skips the PNG encode and the decode ReportLab does for Image, and
+    stays sharp at any zoom. Each run of dark modules in a row is one rect.
+    """
+
+    def __init__(self, matrix: tuple[tuple[bool, ...], ...], size: float):
+        super().__init__()
+        self.matrix = matrix
+        self.width = self.height = size
+        self.hAlign = "CENTER"
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self) -> None:
+        canvas = self.canv
+        n = len(self.matrix)
+        cell = self.width / n
+        path = canvas.beginPath()
+        for r, row in enumerate(self.matrix):
+            y = (n - 1 - r) * cell
+            c = 0
+            while c < n:
+                if row[c]:
+                    start = c
+                    while c < n and row[c]:
+                        c += 1
+                    path.rect(start * cell, y, (c - start) * cell, cell)
+                else:
+                    c += 1
+        canvas.saveState()
+        canvas.setFillColor(colors.black)
+        canvas.drawPath(path, stroke=0, fill=1)
+        canvas.restoreState()
+
+
+def generate_qr_code(url: str) -> QRFlowable | None:
+    """
+    Generate QR code flowable from URL.
 
     Args:
         url: Goal share URL
 
     Returns:
-        reportlab Image object or None on failure
+        QRFlowable (1.5 inch square) or None on failure
     """
     try:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=4,
-            border=2,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, "PNG")
-        img_buffer.seek(0)
-
-        return Image(img_buffer, width=1.5 * inch, height=1.5 * inch)
+        return QRFlowable(_qr_matrix(url), 1.5 * inch)
     except Exception as e:
         logger.error("Error generating QR code: %s", e)
         return None
     
-def add_footer(canvas, doc) -> None:
-    """Add footer to each page."""
-    canvas.saveState()
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p IST")
+# Footer font (name, size), shared by every page
+_FOOTER_FONT = ("Helvetica", 8)
+
 
-    footer_text = (
+def _footer_text() -> str:
+    """Footer line stamped with the current time."""
+    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p IST")
+    return (
         f"Generated on {timestamp} | Mutual Fund Robo-Advisor Prototype | "
         "Comments, Questions or Feedback, email: sankarsana@duck.com"
     )
 
-    canvas.setFont("Helvetica", 8)
+
+def add_footer(canvas, doc, footer_text: str | None = None) -> None:
+    """Add footer to each page (footer_text is computed if not bound)."""
+    canvas.saveState()
+    canvas.setFont(*_FOOTER_FONT)
     canvas.setFillColor(colors.grey)
-    canvas.drawCentredString(4.25 * inch, 0.4 * inch, footer_text)
+    canvas.drawCentredString(4.25 * inch, 0.4 * inch, footer_text or _footer_text())
     canvas.restoreState()
-
-
@@ -14,7 +14,12 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import hashlib
+import io
 import logging
+import sqlite3
+
+import db
+from utils.formatting import format_currency, format_currency_many
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +46,8 @@ def generate_goal_id(registration_id: int | None = None) -> str:
     
     # Create a hash of timestamp + registration_id for uniqueness
     seed = f"{now.isoformat()}{registration_id or 'anon'}"
-    hash_obj = hashlib.md5(seed.encode())
+    # blake2b with a 3-byte digest: cheaper than md5 for a 5-char suffix
+    hash_obj = hashlib.blake2b(seed.encode(), digest_size=3)
     hash_suffix = hash_obj.hexdigest()[:5].upper()
     
     goal_id = f"GOAL_{date_str}_{hash_suffix}"
@@ -52,10 +58,18 @@ def generate_goal_id(registration_id: int | None = None) -> str:
 # GOAL PERSISTENCE (Database Operations)
 # ===================================================================
 
-def save_goal(goal_data: dict) -> str:
+# Fresh goal IDs tried before a save gives up on goal_id collisions
+GOAL_ID_ATTEMPTS = 3
+
+def save_goal(goal_data: dict, status: str = "saved") -> str:
     """
     Save a goal to the database.
     
+    Pass status="email_sent" (or "revisited") to write the final goal
+    state in one statement instead of saving and then marking it. New
+    goals are always INSERTed, never upserted: if the generated goal_id
+    is taken, a fresh one is tried (up to GOAL_ID_ATTEMPTS times).
+    
     Args:
         goal_data: Dict with keys:
           - registration_id (int, optional)
@@ -69,31 +83,24 @@ def save_goal(goal_data: dict) -> str:
           - confidence (str)
           - adjusted_return (float)
           - created_at (str, ISO format)
+        status: Initial goal status (default "saved")
           
     Returns:
         goal_id (str)
     """
     try:
-        import db
-        
-        goal_id = generate_goal_id(goal_data.get("registration_id"))
-        
-        # Call database function to insert goal
-        db.save_goal(
-            goal_id=goal_id,
-            registration_id=goal_data.get("registration_id"),
-            corpus=goal_data["corpus"],
-            sip=goal_data["sip"],
-            horizon=goal_data["horizon"],
-            risk_category=goal_data["risk_category"],
-            conservative_projection=goal_data["conservative_projection"],
-            expected_projection=goal_data["expected_projection"],
-            best_case_projection=goal_data["best_case_projection"],
-            confidence=goal_data["confidence"],
-            adjusted_return=goal_data["adjusted_return"],
-            created_at=goal_data["created_at"]
-        )
+        for attempt in range(1, GOAL_ID_ATTEMPTS + 1):
+            goal_id = generate_goal_id(goal_data.get("registration_id"))
+            try:
+                _insert_goal(goal_id, goal_data, status)
+                break
+            except sqlite3.IntegrityError as e:
+                # Retry only a goal_id collision (short hash suffix)
+                if "goal_id" not in str(e) or attempt == GOAL_ID_ATTEMPTS:
+                    raise
+                logger.warning(f"Goal ID collision on {goal_id}; retrying")
         
+        _cached_user_goals.clear()
         logger.info(f"Goal saved: {goal_id}")
         return goal_id
     
@@ -102,6 +109,26 @@ def save_goal(goal_data: dict) -> str:
         raise
 
 
+def _insert_goal(goal_id: str, goal_data: dict, status: str) -> None:
+    """Insert goal_data as a new goal (raises IntegrityError on a taken ID)."""
+    # Single INSERT writes the goal in its final status
+    db.save_goal(
+        goal_id=goal_id,
+        registration_id=goal_data.get("registration_id"),
+        corpus=goal_data["corpus"],
+        sip=goal_data["sip"],
+        horizon=goal_data["horizon"],
+        risk_category=goal_data["risk_category"],
+        conservative_projection=goal_data["conservative_projection"],
+        expected_projection=goal_data["expected_projection"],
+        best_case_projection=goal_data["best_case_projection"],
+        confidence=goal_data["confidence"],
+        adjusted_return=goal_data["adjusted_return"],
+        created_at=goal_data["created_at"],
+        status=status,
+    )
+
+
 def retrieve_goal(goal_id: str) -> dict:
     """
     Retrieve a saved goal by ID.
@@ -113,7 +140,6 @@ def retrieve_goal(goal_id: str) -> dict:
         Goal data dict or empty dict if not found
     """
     try:
-        import db
         goal = db.get_goal(goal_id)
         return goal if goal is not None else {}
     
@@ -122,6 +148,17 @@ def retrieve_goal(goal_id: str) -> dict:
         return {}
 
 
+# Goal history reruns on every widget interaction. Goal writes in this
+# module clear the cache; the TTL bounds staleness from other processes.
+GOALS_CACHE_TTL = 60
+
+
+@st.cache_data(ttl=GOALS_CACHE_TTL, show_spinner=False)
+def _cached_user_goals(registration_id: int) -> pd.DataFrame:
+    """Cached db.get_user_goals() as a DataFrame (errors are not cached)."""
+    return pd.DataFrame(db.get_user_goals(registration_id))
+
+
 def get_user_goals(registration_id: int) -> pd.DataFrame:
     """
     Retrieve all goals for a user.
@@ -133,9 +170,7 @@ def get_user_goals(registration_id: int) -> pd.DataFrame:
         DataFrame with all user's goals
     """
     try:
-        import db
-        goals_df = db.get_user_goals(registration_id)
-        return goals_df
+        return _cached_user_goals(registration_id)
     
     except Exception as e:
         logger.error(f"Error retrieving goals for user {registration_id}: {e}")
@@ -153,8 +188,8 @@ def mark_goal_email_sent(goal_id: str) -> bool:
         True if successful
     """
     try:
-        import db
         db.mark_goal_email_sent(goal_id)
+        _cached_user_goals.clear()
         logger.info(f"Goal {goal_id} marked as email sent")
         return True
     
@@ -174,8 +209,8 @@ def mark_goal_revisited(goal_id: str) -> bool:
         True if successful
     """
     try:
-        import db
         db.mark_goal_revisited(goal_id)
+        _cached_user_goals.clear()
         logger.info(f"Goal {goal_id} marked as revisited")
         return True
     
@@ -198,8 +233,6 @@ def format_goal_for_display(goal: dict) -> dict:
     Returns:
         Formatted dict with currency/percentage strings
     """
-    from utils.formatting import format_currency, format_percentage
-    
     return {
         "Goal ID": goal.get("goal_id"),
         "Created": goal.get("created_at"),
@@ -213,10 +246,45 @@ def format_goal_for_display(goal: dict) -> dict:
     }
 
 
+def format_goals_df(goals_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise format_goal_for_display over a whole goals DataFrame.
+    
+    Args:
+        goals_df: Raw goals DataFrame (db.get_user_goals rows)
+        
+    Returns:
+        DataFrame with the same display columns and strings
+    """
+    def _money(column: str) -> list:
+        return format_currency_many(goals_df[column].fillna(0).tolist())
+    
+    return pd.DataFrame(
+        {
+            "Goal ID": goals_df["goal_id"],
+            "Created": goals_df["created_at"],
+            "Corpus": _money("corpus"),
+            "Monthly SIP": _money("sip"),
+            "Horizon": goals_df["horizon"].astype(str) + " years",
+            "Risk": goals_df["risk_category"],
+            "Expected Projection": _money("expected_projection"),
+            "Confidence": goals_df["confidence"],
+            "Status": goals_df["status"],
+        },
+        index=goals_df.index,
+    )
+
+
 # ===================================================================
 # UI COMPONENTS - Goal Retrieval & History
 # ===================================================================
 
+# Goal history table columns, in display order (a list so pandas
+# selects columns rather than a tuple key)
+GOAL_HISTORY_COLUMNS = ["Goal ID", "Created", "Corpus", "Monthly SIP", "Horizon",
+                        "Risk", "Expected Projection", "Confidence"]
+
+
 def render_goal_history():
     """
     Render a page showing user's goal history (Phase 4 - Dashboard).
@@ -250,17 +318,19 @@ def render_goal_history():
     st.markdown("---")
     
     # Display goals table
-    display_cols = ["Goal ID", "Created", "Corpus", "Monthly SIP", "Horizon", 
-                    "Risk", "Expected Projection", "Confidence"]
-    
-    if all(col in goals_df.columns for col in display_cols):
-        st.dataframe(
-            goals_df[display_cols],
-            width = 'stretch',
-            hide_index=True
-        )
-    else:
-        st.dataframe(goals_df, width = 'stretch', hide_index=True)
+    st.dataframe(
+        format_goals_df(goals_df)[GOAL_HISTORY_COLUMNS],
+        width = 'stretch',
+        hide_index=True
+    )
+    
+    st.download_button(
+        "📥 Download Goals (CSV)",
+        data=export_goals_to_csv(reg_id),
+        file_name=f"goals_{reg_id}.csv",
+        mime="text/csv",
+        width='stretch'
+    )
     
     st.markdown("---")
     
@@ -349,30 +419,31 @@ def render_goal_share():
 # EXPORT GOALS
 # ===================================================================
 
-def export_goals_to_csv(registration_id: int) -> str:
+def export_goals_to_csv(registration_id: int) -> bytes:
     """
-    Export user's goals to CSV file (for download).
+    Export user's goals as CSV bytes (for st.download_button).
+    
+    Built in memory; nothing is written to the server disk.
     
     Args:
         registration_id: User's registration ID
         
     Returns:
-        Path to CSV file
+        UTF-8 CSV bytes, or b'' if there are no goals or on error
     """
     try:
-        import db
-        
-        goals_df = db.get_user_goals(registration_id)
+        goals_df = get_user_goals(registration_id)
         
         if goals_df.empty:
-            return ''
+            return b''
         
-        filename = f"goals_{registration_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        goals_df.to_csv(filename, index=False)
+        buf = io.StringIO()
+        goals_df.to_csv(buf, index=False)
         
-        logger.info(f"Goals exported to {filename}")
-        return filename
+        logger.info(f"Goals exported for registration {registration_id}")
+        return buf.getvalue().encode("utf-8")
     
     except Exception as e:
         logger.error(f"Error exporting goals: {e}")
-        return ''
\ No newline at end of file
+        return b''
+
@@ -3,34 +3,65 @@
 Fund recommendations, filtering, and display (Phase 2 + Phase 3)
 """
 
+import os
+
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+import db
 from modules.utils_ui import render_feedback_footer
 from utils.constants import (
     CATEGORY_RETURNS, CATEGORY_VOLATILITY, RISK_HIERARCHY, DURATION_MAP, ALLOWED_FUND_TYPES, 
-    DURATION_HIERARCHY, DEFAULT_DISPLAY_COUNT, VOLATILITY_BENCHMARKS
+    DURATION_HIERARCHY, DEFAULT_DISPLAY_COUNT, VOLATILITY_BENCHMARKS,
+    CONFIDENCE_PERCENTAGES, CONFIDENCE_TABLE, CSV_FILE,
+)
+from utils.formatting import (
+    format_currency,
+    format_crores_many,
+    format_currency_many,
+    format_percentage_many,
 )
-from utils.formatting import format_percentage, format_crores, format_currency
 
 logger = logging.getLogger(__name__)
 
 
-def get_freshness_badge(last_updated_str: str) -> dict:
+class FreshnessBadge(NamedTuple):
+    """Data freshness badge for a fund's last_updated date."""
+    badge_text: str
+    badge_color: str
+    days_old: Optional[int]
+    status: str
+
+
+def get_freshness_badge(last_updated_str: str, today: Optional[date] = None) -> FreshnessBadge:
     """
     Calculate freshness badge status and color based on last_updated date.
     
+    Results are cached per (date string, today); pass today once per
+    render so a whole table of funds shares the same reference date.
+    
     Args:
         last_updated_str: Date string in YYYY-MM-DD format
+        today: Reference date (defaults to the current date)
         
     Returns:
-        dict with keys: 'badge_text', 'badge_color', 'days_old', 'status'
+        FreshnessBadge with badge_text, badge_color, days_old, status
     """
+    if today is None:
+        today = datetime.now().date()
+    return _freshness_badge(last_updated_str, today)
+
+
+@lru_cache(maxsize=64)
+def _freshness_badge(last_updated_str: str, today: date) -> FreshnessBadge:
+    """get_freshness_badge for an explicit reference date (cached)."""
     try:
         last_updated_date = datetime.strptime(last_updated_str, "%Y-%m-%d").date()
-        today = datetime.now().date()
         days_old = (today - last_updated_date).days
         
         if days_old < 7:
@@ -46,21 +77,13 @@ def get_freshness_badge(last_updated_str: str) -> dict:
             badge_text = f"🔴 Data stale ({days_old} days old)"
             status = "stale"
         
-        return {
-            'badge_text': badge_text,
-            'badge_color': badge_color,
-            'days_old': days_old,
-            'status': status
-        }
+        return FreshnessBadge(badge_text, badge_color, days_old, status)
     
     except Exception as e:
         logger.warning(f"Error parsing last_updated date '{last_updated_str}': {e}")
-        return {
-            'badge_text': '⚠️ Unknown data freshness',
-            'badge_color': '⚠️',
-            'days_old': None,
-            'status': 'unknown'
-        }
+        return FreshnessBadge('⚠️ Unknown data freshness', '⚠️', None, 'unknown')
+
+
 # ===================================================================
 # Mean Reversion & Return Assumptions (Phase 3)
 # ===================================================================
@@ -160,37 +183,18 @@ def get_confidence_score(volatility: float, fund_age_years: int = 10) -> str:
         - Medium: Moderate volatility (5-10%) + any age, OR good volatility + young
         - Low: High volatility (>10%) OR very young fund (<2 years)
     """
-    # Score volatility (70% weight)
-    if volatility <= 5.0:
-        vol_score = 3  # High
-    elif volatility <= 10.0:
-        vol_score = 2  # Medium
-    else:
-        vol_score = 1  # Low
-    
-    # Score age (30% weight)
-    if fund_age_years >= 10:
-        age_score = 3  # High
-    elif fund_age_years >= 5:
-        age_score = 2  # Medium
-    else:
-        age_score = 1  # Low
-    
-    # Weighted combination: volatility (70%) + age (30%)
-    combined_score = (vol_score * 0.7) + (age_score * 0.3)
-    
-    # Map combined score back to confidence level
-    if combined_score >= 2.5:
-        final_confidence = "High"
-    elif combined_score >= 1.5:
-        final_confidence = "Medium"
-    else:
-        final_confidence = "Low"
-    
-    logger.debug(
-        f"Confidence Score: {final_confidence} "
-        f"(combined: {combined_score:.2f}, vol: {vol_score}/3, age: {age_score}/3)"
-    )
+    # Bucket each input by thresholds missed (a NaN volatility lands in
+    # the >10% bucket, as with an if/elif ladder), then look up the
+    # precomputed weighted-score result
+    vol_bucket = 2 - (volatility <= 10.0) - (volatility <= 5.0)
+    age_bucket = 2 - (fund_age_years >= 5) - (fund_age_years >= 10)
+    final_confidence = CONFIDENCE_TABLE[age_bucket * 3 + vol_bucket]
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Confidence Score: %s (vol: %d/3, age: %d/3)",
+            final_confidence, 3 - vol_bucket, 3 - age_bucket,
+        )
     
     return final_confidence
 
@@ -213,13 +217,44 @@ def get_confidence_percentage(confidence_level: str) -> int:
         >>> get_confidence_percentage("Low")
         25
     """
-    confidence_map = {
-        "High": 70,      # ~70% confidence (conservative)
-        "Medium": 50,    # ~50% confidence (expected)
-        "Low": 25        # ~25% confidence (best case)
-    }
+    return CONFIDENCE_PERCENTAGES.get(confidence_level, 50)
+
+
+# Recommendation order: best rating, then 5y/3y returns, then lowest cost
+_RANK_COLUMNS = ["rating", "return_5y", "return_3y", "exp_ratio"]
+_RANK_ASCENDING = [False, False, False, True]
+
+
+def presort_fund_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort the fund universe into recommendation order once, at load time.
     
-    return confidence_map.get(confidence_level, 50)
+    The sort is stable, so any filtered subset is already in the order
+    filter_and_sort_recommendations would produce. Only get_recommendations,
+    which reads the presorted load_fund_data frame, relies on this.
+    
+    Args:
+        df: Fund dataframe
+        
+    Returns:
+        Sorted dataframe
+    """
+    return df.sort_values(by=_RANK_COLUMNS, ascending=_RANK_ASCENDING, kind="stable")
+
+
+def _isin(column: pd.Series, allowed) -> np.ndarray:
+    """
+    Boolean array of column values in allowed.
+    
+    Categorical columns (see load_fund_data) are matched on their integer
+    codes: the few allowed labels are resolved to codes once, then the
+    comparison runs over the small code array instead of hashing labels.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.categories.get_indexer(list(allowed))
+        # -1 marks labels absent from the categories (and NaN rows); drop it
+        return np.isin(column.cat.codes.to_numpy(), codes[codes >= 0])
+    return column.isin(allowed).to_numpy()
 
 
 def filter_and_sort_recommendations(
@@ -231,6 +266,8 @@ def filter_and_sort_recommendations(
     """
     Filter and sort fund recommendations based on risk, amount, and duration.
     
+    All filters are combined into one mask, so a single subset is taken.
+    
     Args:
         df: Fund dataframe
         risk_category: User's risk category
@@ -240,46 +277,128 @@ def filter_and_sort_recommendations(
     Returns:
         Filtered and sorted dataframe
     """
+    return _filter_recommendations(
+        df, risk_category, investment_amount, duration, presorted=False
+    )
+
+
+def _filter_recommendations(
+    df: pd.DataFrame,
+    risk_category: str,
+    investment_amount: float,
+    duration: str,
+    presorted: bool,
+) -> pd.DataFrame:
+    """filter_and_sort_recommendations; presorted=True skips the sort."""
     internal_duration = DURATION_MAP.get(duration, "")
     allowed_risk_profiles = RISK_HIERARCHY.get(risk_category, [risk_category])
-    
-    # Filter by risk profile
-    df_step1 = df[df["risk_profile"].isin(allowed_risk_profiles)].copy()
-    
-    # Filter by investment amount
-    df_step2 = df_step1[df_step1["min_investment"] <= investment_amount].copy()
-    
-    # Filter by duration
     allowed_durations = DURATION_HIERARCHY.get(internal_duration, [internal_duration])
-    df_step3 = df_step2[df_step2["duration"].isin(allowed_durations)].copy()
+    
+    # Filter by risk profile, investment amount and duration
+    mask = (
+        _isin(df["risk_profile"], allowed_risk_profiles)
+        & (df["min_investment"].to_numpy() <= investment_amount)
+        & _isin(df["duration"], allowed_durations)
+    )
     
     # Filter by fund type/category
     allowed_rules = ALLOWED_FUND_TYPES.get(internal_duration)
     if allowed_rules:
-        df_step3 = df_step3[df_step3["fund_type"].isin(allowed_rules["Type"])].copy()
+        mask &= _isin(df["fund_type"], allowed_rules["Type"])
         cats = allowed_rules.get("Category") or []
         if cats:
-            df_step3 = df_step3[df_step3["fund_category"].isin(cats)].copy()
+            mask &= _isin(df["fund_category"], cats)
+    
+    filtered = df.loc[mask]
     
     # Sort by rating, returns, expense ratio
-    sorted_df = df_step3.sort_values(
-        by=["rating", "return_5y", "return_3y", "exp_ratio"],
-        ascending=[False, False, False, True]
-    )
+    if not presorted:
+        filtered = filtered.sort_values(by=_RANK_COLUMNS, ascending=_RANK_ASCENDING)
     
     # Remove duplicates
-    sorted_df = sorted_df.drop_duplicates(subset=['fund_name'], keep='first')
+    return filtered.drop_duplicates(subset=['fund_name'], keep='first')
+
+
+def _fund_data_version() -> float:
+    """Modification time of the fund CSV (0.0 if missing), used as a cache key."""
+    try:
+        return os.path.getmtime(CSV_FILE)
+    except OSError:
+        return 0.0
+
+
+def get_recommendations(
+    risk_category: str, investment_amount: float, duration: str
+) -> pd.DataFrame:
+    """
+    filter_and_sort_recommendations over the loaded fund data, cached.
+    
+    Keyed on the three filter inputs plus the fund CSV's modification
+    time, so Show More and other reruns with unchanged preferences skip
+    the filter pass, and an edited CSV is picked up on the next call.
+    
+    Args:
+        risk_category: User's risk category
+        investment_amount: Investment amount in ₹
+        duration: Investment duration string
+        
+    Returns:
+        Filtered and sorted dataframe
+    """
+    return _cached_recommendations(
+        risk_category, investment_amount, duration, _fund_data_version()
+    )
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_recommendations(
+    risk_category: str, investment_amount: float, duration: str, data_version: float
+) -> pd.DataFrame:
+    """get_recommendations body; data_version only keys the cache."""
+    from roboadvisor import load_fund_data
+    # load_fund_data returns the frame already in rank order (presort_fund_data)
+    return _filter_recommendations(
+        load_fund_data(data_version),
+        risk_category,
+        investment_amount,
+        duration,
+        presorted=True,
+    )
+
+
+def freshness_badge_map(
+    last_updated: pd.Series, today: Optional[date] = None
+) -> dict[str, FreshnessBadge]:
+    """
+    Freshness badge for each distinct last_updated value.
     
-    return sorted_df
+    Funds share a handful of update dates, so badges are computed once
+    per date rather than once per row.
+    
+    Args:
+        last_updated: Series of YYYY-MM-DD date strings
+        today: Reference date (defaults to the current date)
+        
+    Returns:
+        Dict mapping each distinct date string to its FreshnessBadge
+    """
+    return {d: get_freshness_badge(d, today) for d in last_updated.unique()}
 
 
-def format_recommendation_table(df_sorted: pd.DataFrame, limit=None) -> pd.DataFrame:
+def format_recommendation_table(
+    df_sorted: pd.DataFrame,
+    limit=None,
+    today: Optional[date] = None,
+    badge_map: Optional[dict[str, FreshnessBadge]] = None,
+) -> pd.DataFrame:
     """
     Format recommendation table with all columns including freshness badge.
     
     Args:
         df_sorted: Sorted fund dataframe
         limit: Number of rows to display
+        today: Reference date for freshness badges (defaults to today)
+        badge_map: Precomputed freshness_badge_map covering df_sorted
         
     Returns:
         Formatted dataframe ready for st.dataframe()
@@ -287,17 +406,21 @@ def format_recommendation_table(df_sorted: pd.DataFrame, limit=None) -> pd.DataF
     display_df = df_sorted.head(limit or len(df_sorted)).reset_index(drop=True)
     display_df["Rank"] = display_df.index + 1
     
-    # Apply formatting
-    display_df["aum_cr"] = display_df["aum_cr"].apply(format_crores)
-    display_df["return_1y"] = display_df["return_1y"].fillna(0).apply(format_percentage)
-    display_df["return_3y"] = display_df["return_3y"].fillna(0).apply(format_percentage)
-    display_df["return_5y"] = display_df["return_5y"].fillna(0).apply(format_percentage)
-    display_df["exp_ratio"] = display_df["exp_ratio"].apply(format_percentage)
-    display_df["min_investment"] = display_df["min_investment"].apply(format_currency)
+    # Apply formatting (one list pass per column)
+    display_df["aum_cr"] = format_crores_many(display_df["aum_cr"].tolist())
+    returns = display_df[["return_1y", "return_3y", "return_5y"]].fillna(0)
+    for col in returns.columns:
+        display_df[col] = format_percentage_many(returns[col].tolist())
+    display_df["exp_ratio"] = format_percentage_many(display_df["exp_ratio"].tolist())
+    display_df["min_investment"] = format_currency_many(display_df["min_investment"].tolist())
     
     # Phase 3: Add data freshness badge
-    display_df["Data Freshness"] = display_df["last_updated"].apply(
-        lambda x: get_freshness_badge(x)['badge_text']
+    if today is None:
+        today = datetime.now().date()
+    if badge_map is None:
+        badge_map = freshness_badge_map(display_df["last_updated"], today)
+    display_df["Data Freshness"] = display_df["last_updated"].map(
+        {d: badge.badge_text for d, badge in badge_map.items()}
     )
     
     display_cols = [
@@ -352,12 +475,13 @@ def render_recommendations_display():
         render_feedback_footer()
         return
 
-    # Mark recommendations_viewed for registered users (non-blocking)
+    # Mark recommendations_viewed for registered users (non-blocking).
+    # Written once per registration per session, not on every rerun.
     reg_id = st.session_state.get("registration_id")
-    if reg_id:
+    if reg_id and st.session_state.get("recos_viewed_marked_for") != reg_id:
         try:
-            import db
             db.mark_recommendations_viewed(reg_id)
+            st.session_state["recos_viewed_marked_for"] = reg_id
         except Exception:
             pass  # Non-blocking
 
@@ -370,25 +494,21 @@ def render_recommendations_display():
     )
 
     # Load data and compute recommendations
-    from roboadvisor import load_fund_data
-    fund_df = load_fund_data()
-    recommended_funds = filter_and_sort_recommendations(
-        fund_df,
-        risk_category,
-        investment_amount,
-        duration,
-    )
+    recommended_funds = get_recommendations(risk_category, investment_amount, duration)
 
-    # Check for stale data
+    # Check for stale data (one reference date and badge per date for the
+    # whole render, shared with the table below)
+    today = datetime.now().date()
+    badge_map = freshness_badge_map(recommended_funds["last_updated"], today)
     if not recommended_funds.empty:
-        stale_funds = recommended_funds[
-            recommended_funds["last_updated"].apply(
-                lambda x: get_freshness_badge(x)["status"] == "stale"
-            )
-        ]
-        if not stale_funds.empty:
+        stale_count = int(
+            recommended_funds["last_updated"]
+            .map({d: badge.status == "stale" for d, badge in badge_map.items()})
+            .sum()
+        )
+        if stale_count:
             st.warning(
-                f"⚠️ **Data Alert:** {len(stale_funds)} fund(s) have data older than 4 weeks. "
+                f"⚠️ **Data Alert:** {stale_count} fund(s) have data older than 4 weeks. "
                 f"Consider refreshing data by running the data pipeline."
             )
 
@@ -407,7 +527,7 @@ def render_recommendations_display():
 
     # Display table
     final_display_df = format_recommendation_table(
-        recommended_funds, st.session_state.display_limit
+        recommended_funds, st.session_state.display_limit, today, badge_map
     )
     st.dataframe(final_display_df, width="stretch", hide_index=True)
 
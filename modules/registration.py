@@ -4,10 +4,22 @@ User registration and preference input (Phase 2)
 """
 
 import streamlit as st
+
+import db
 from utils.constants import DEFAULT_DISPLAY_COUNT, DURATION_OPTIONS
 from utils.validators import is_valid_email
 from modules.utils_ui import navigate_to_home
 
+# Country dropdown options (built once, not on every rerun)
+_COUNTRIES = (
+    "India",
+    "United Arab Emirates",
+    "United States",
+    "Singapore",
+    "United Kingdom",
+    "Other",
+)
+
 
 def registration_and_recommendation_flow(risk_score: int, risk_category: str) -> None:
     """
@@ -32,22 +44,22 @@ def registration_and_recommendation_flow(risk_score: int, risk_category: str) ->
     if "registration_id" not in st.session_state:
         st.session_state.registration_id = None
     
+    # Already registered this session: skip the form (and any re-insert)
+    if st.session_state.registration_id is not None:
+        st.success("You're already registered for this session.")
+        if st.button("Continue to Investment Details", type="primary"):
+            st.session_state.current_step = "preference_input"
+            st.rerun()
+        if st.button("⬅️ Back to Risk Assessment"):
+            st.session_state.current_step = "risk_assessment"
+            st.rerun()
+        return
+    
     with st.form("registration_form"):
         name = st.text_input("Full Name (optional)")
         email = st.text_input("Email *")
         city = st.text_input("City (optional)", value="Bengaluru")
-        country = st.selectbox(
-            "Country",
-            [
-                "India",
-                "United Arab Emirates",
-                "United States",
-                "Singapore",
-                "United Kingdom",
-                "Other",
-            ],
-            index=0,
-        )
+        country = st.selectbox("Country", _COUNTRIES, index=0)
         consent = st.checkbox(
             "I agree to share my details for prototype research and to receive no emails."
         )
@@ -67,7 +79,6 @@ def registration_and_recommendation_flow(risk_score: int, risk_category: str) ->
             st.error("Please tick the consent checkbox to register.")
         else:
             try:
-                import db
                 reg_id = db.save_registration(
                     name=name or None,
                     email=email,
@@ -3,10 +3,16 @@
 Risk Assessment Questionnaire & Scoring (Phase 2)
 """
 
+from bisect import bisect_right
+
 import streamlit as st
 from modules.utils_ui import init_session_state, render_feedback_footer
 from utils.constants import RISK_QUESTIONNAIRE, RISK_CATEGORIES
 
+# Score bands ordered by lower bound, for a binary search on the total
+_PROFILES_BY_LOW = sorted(RISK_CATEGORIES, key=lambda profile: profile["range"][0])
+_RANGE_LOWS = [profile["range"][0] for profile in _PROFILES_BY_LOW]
+
 
 def calculate_risk_score(answers: dict) -> tuple:
     """
@@ -19,17 +25,16 @@ def calculate_risk_score(answers: dict) -> tuple:
         Tuple: (total_score, category_name, category_description)
     """
     total_score = sum(answers.values())
-    category = None
-    description = "Category not defined by score."
     
-    for profile in RISK_CATEGORIES:
-        low, high = profile["range"]
-        if low <= total_score <= high:
-            category = profile["name"]
-            description = profile["description"]
-            break
+    # Last band starting at or below the score; it matches if the score
+    # is within its upper bound too
+    idx = bisect_right(_RANGE_LOWS, total_score) - 1
+    if idx >= 0:
+        profile = _PROFILES_BY_LOW[idx]
+        if total_score <= profile["range"][1]:
+            return total_score, profile["name"], profile["description"]
     
-    return total_score, category, description
+    return total_score, None, "Category not defined by score."
 
 def render_risk_assessment():
     """Render risk assessment questionnaire form."""
@@ -37,11 +37,16 @@ logger = logging.getLogger(__name__)
 # IMPORTS: Modules & Utils
 # ===================================================================
 
+import db
 from modules.quick_risk import render_quick_risk
 from modules.utils_ui import init_session_state, render_home_page, render_feedback_footer
 from modules.risk_assessment import render_risk_assessment, calculate_risk_score
 from modules.registration import registration_and_recommendation_flow, render_preference_input
-from modules.recommendations import apply_mean_reversion, render_recommendations_display
+from modules.recommendations import (
+    apply_mean_reversion,
+    presort_fund_data,
+    render_recommendations_display,
+)
 
 from utils.constants import (
                             CATEGORY_RETURNS, 
@@ -67,8 +72,14 @@ st.set_page_config(
 # ===================================================================
 
 @st.cache_data(show_spinner="Loading and validating fund data...")
-def load_fund_data() -> pd.DataFrame:
-    """Loads and validates the fund data."""
+def load_fund_data(data_version: float = 0.0) -> pd.DataFrame:
+    """
+    Loads and validates the fund data.
+    
+    Args:
+        data_version: Fund CSV modification time; only keys the cache,
+            so an edited CSV is reloaded
+    """
     try:
         df = pd.read_csv(CSV_FILE)
         
@@ -89,7 +100,16 @@ def load_fund_data() -> pd.DataFrame:
         else:
             df["last_updated"] = df["last_updated"].astype(str).str.strip()
         
-        return df
+        # Low-cardinality filter columns: categorical codes make isin cheap
+        df = df.astype({
+            "risk_profile": "category",
+            "duration": "category",
+            "fund_type": "category",
+            "fund_category": "category",
+        })
+        
+        # Rank once here so each recommendation request only filters
+        return presort_fund_data(df)
         
     except FileNotFoundError:
         st.error(f"Error: Required data file '{CSV_FILE}' not found.")
@@ -106,38 +126,75 @@ def load_fund_data() -> pd.DataFrame:
 # ADMIN PAGE (Phase 2)
 # ===================================================================
 
+# Admin reruns on every widget interaction. The overview aggregates are
+# cached for ADMIN_CACHE_TTL seconds and keyed on the db registrations
+# write version, so a new registration shows up on the next rerun.
+# db.fetch_latest_registrations keeps its own version-keyed cache.
+ADMIN_CACHE_TTL = 30
+
+
+@st.cache_data(ttl=ADMIN_CACHE_TTL, show_spinner=False)
+def _cached_overview_metrics(reg_version: int) -> dict:
+    """
+    Cached db.get_overview_metrics() for the admin page.
+    
+    Args:
+        reg_version: db.get_registrations_version(); part of the cache key
+        
+    Returns:
+        Overview metrics dict; by_country / top_cities rows as dicts
+        (sqlite3.Row is not picklable)
+    """
+    metrics = db.get_overview_metrics()
+    metrics["by_country"] = [dict(r) for r in metrics["by_country"]]
+    metrics["top_cities"] = [dict(r) for r in metrics["top_cities"]]
+    return metrics
+
+
 def render_admin_page():
     """Render admin/analytics page."""
     st.title("📊 Admin Panel")
     st.subheader("Analytics & Registration Data")
     
     try:
-        import db
-        
         # Overview cards
         col1, col2, col3 = st.columns(3)
         
-        stats = db.get_overview_metrics()
+        stats = _cached_overview_metrics(db.get_registrations_version())
         
         with col1:
-            st.metric("Total Registrations", stats.get("total_registrations", 0))
+            st.metric("Total Registrations", stats.get("total_registered", 0))
         with col2:
-            st.metric("Questionnaires Completed", stats.get("questionnaires_completed", 0))
+            st.metric("Questionnaires Completed", stats.get("total_questionnaire_completed", 0))
         with col3:
-            st.metric("Recommendations Viewed", stats.get("recommendations_viewed", 0))
+            st.metric("Recommendations Viewed", stats.get("total_recommendations_viewed", 0))
+        
+        st.markdown("---")
+        
+        # Latest registrations
+        st.write("**Latest Registrations:**")
+        latest_rows = db.fetch_latest_registrations(50)
+        if not latest_rows:
+            st.info("No registrations yet.")
+        else:
+            # db.fetch_latest_registrations already omits user_id in its SELECT
+            st.table(pd.DataFrame.from_records(latest_rows, columns=latest_rows[0].keys()))
         
         st.markdown("---")
         
         # Export button
         if st.button("📥 Export Registrations to CSV"):
-            csv_file = db.export_registrations_csv()
-            with open(csv_file, "rb") as f:
-                st.download_button(
-                    label="Download CSV",
-                    data=f.read(),
-                    file_name="registrations.csv",
-                    mime="text/csv"
-                )
+            # Encode chunk by chunk; the CSV text is never held as one str
+            csv_bytes = b"".join(
+                chunk.encode("utf-8")
+                for chunk in db.export_registrations_csv_iter()
+            )
+            st.download_button(
+                label="Download CSV",
+                data=csv_bytes,
+                file_name="registrations.csv",
+                mime="text/csv"
+            )
         
         st.markdown("---")
         
@@ -197,7 +254,6 @@ def main():
     init_session_state()
     
     # NEW - Initialize database (creates registrations + goals tables)
-    import db
     db.init_db()
     
     # Check for admin route
@@ -0,0 +1,270 @@
+"""
+Unit Tests for the SQLite persistence layer (db.py)
+
+Run with: python tests/test_db.py
+
+Each test points ROBO_DB_PATH at a fresh temporary database file;
+db.get_connection() closes the old connection and opens a new one
+whenever the path changes.
+
+Tests cover:
+- Legacy goals table (AUTOINCREMENT id) migrated to WITHOUT ROWID
+- init_db() re-run is a no-op
+- save_or_update_goal() updates in place
+- Bulk inserts (registrations and goals)
+- Changing ROBO_DB_PATH closes the previous connection
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import db
+
+
+# ===================================================================
+# HELPERS
+# ===================================================================
+
+@contextmanager
+def temp_db():
+    """Point ROBO_DB_PATH at a fresh database file for the block."""
+    old_path = os.environ.get("ROBO_DB_PATH")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["ROBO_DB_PATH"] = os.path.join(tmp_dir, "robo_test.db")
+        try:
+            yield db.get_connection()
+        finally:
+            db.get_connection().close()
+            if old_path is None:
+                os.environ.pop("ROBO_DB_PATH", None)
+            else:
+                os.environ["ROBO_DB_PATH"] = old_path
+
+
+def make_goal(goal_id, **overrides):
+    """Build a goal dict with save_goal's keyword arguments."""
+    goal = {
+        "goal_id": goal_id,
+        "registration_id": 1,
+        "corpus": 100000.0,
+        "sip": 5000.0,
+        "horizon": 10,
+        "risk_category": "Medium Risk",
+        "conservative_projection": 1000000.0,
+        "expected_projection": 1200000.0,
+        "best_case_projection": 1400000.0,
+        "confidence": "Medium",
+        "adjusted_return": 9.0,
+        "created_at": "2026-01-01T00:00:00",
+    }
+    goal.update(overrides)
+    return goal
+
+
+LEGACY_GOALS_SQL = """
+    CREATE TABLE goals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        goal_id TEXT UNIQUE NOT NULL,
+        registration_id INTEGER,
+        corpus REAL NOT NULL,
+        sip REAL NOT NULL,
+        horizon INTEGER NOT NULL,
+        risk_category TEXT NOT NULL,
+        conservative_projection REAL,
+        expected_projection REAL,
+        best_case_projection REAL,
+        confidence TEXT,
+        adjusted_return REAL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        status TEXT DEFAULT 'saved',
+        email_sent_at TEXT,
+        revisited_at TEXT
+    )
+"""
+
+
+# ===================================================================
+# TEST CASES
+# ===================================================================
+
+def test_legacy_goals_migration_keeps_rows():
+    """Test init_db migrates a legacy goals table without losing rows"""
+    with temp_db() as conn:
+        conn.execute(LEGACY_GOALS_SQL)
+        for i in range(3):
+            conn.execute(
+                """
+                INSERT INTO goals (goal_id, registration_id, corpus, sip,
+                    horizon, risk_category, created_at, updated_at, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (f"GOAL_LEGACY_{i}", 7, 1000.0 * i, 500.0, 5,
+                 "Low Risk", "2025-12-08", "2025-12-08", "email_sent"),
+            )
+
+        db.init_db()
+
+        columns = [r["name"] for r in conn.execute("PRAGMA table_info(goals)")]
+        assert "id" not in columns
+
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'goals'"
+        ).fetchone()[0]
+        assert "WITHOUT ROWID" in table_sql
+
+        goals = db.get_user_goals(7)
+        assert sorted(g["goal_id"] for g in goals) == [
+            "GOAL_LEGACY_0", "GOAL_LEGACY_1", "GOAL_LEGACY_2"
+        ]
+        assert db.get_goal("GOAL_LEGACY_2")["corpus"] == 2000.0
+        assert db.get_goal("GOAL_LEGACY_2")["status"] == "email_sent"
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+
+    print("✅ Legacy goals table migrated, rows kept")
+
+
+def test_init_db_rerun_is_noop():
+    """Test calling init_db twice keeps schema version and data"""
+    with temp_db() as conn:
+        db.init_db()
+        db.save_goal(**make_goal("GOAL_RERUN"))
+        schema_before = conn.execute(
+            "SELECT name, sql FROM sqlite_master ORDER BY name"
+        ).fetchall()
+
+        db.init_db()
+
+        schema_after = conn.execute(
+            "SELECT name, sql FROM sqlite_master ORDER BY name"
+        ).fetchall()
+        assert [tuple(r) for r in schema_after] == [tuple(r) for r in schema_before]
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+        assert db.get_goal("GOAL_RERUN") is not None
+
+    print("✅ init_db re-run is a no-op")
+
+
+def test_save_or_update_goal_updates_in_place():
+    """Test save_or_update_goal updates an existing goal instead of duplicating it"""
+    with temp_db() as conn:
+        db.init_db()
+        db.save_or_update_goal(**make_goal("GOAL_UPSERT"))
+        db.save_or_update_goal(
+            **make_goal(
+                "GOAL_UPSERT",
+                sip=7500.0,
+                created_at="2026-06-01T00:00:00",
+                status="email_sent",
+            )
+        )
+
+        count = conn.execute(
+            "SELECT COUNT(*) FROM goals WHERE goal_id = ?", ("GOAL_UPSERT",)
+        ).fetchone()[0]
+        assert count == 1
+
+        goal = db.get_goal("GOAL_UPSERT")
+        assert goal["sip"] == 7500.0
+        assert goal["status"] == "email_sent"
+        assert goal["email_sent_at"] is not None
+        # created_at is only set on first insert
+        assert goal["created_at"] == "2026-01-01T00:00:00"
+
+    print("✅ save_or_update_goal updates in place")
+
+
+def test_save_registrations_bulk_counts():
+    """Test bulk registration insert returns one ID per row, in order"""
+    with temp_db() as conn:
+        db.init_db()
+        assert db.save_registrations_bulk([]) == []
+
+        regs = [
+            {"email": f"user{i}@example.com", "country": "India", "consent": True}
+            for i in range(5)
+        ]
+        ids = db.save_registrations_bulk(regs)
+
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+        assert conn.execute("SELECT COUNT(*) FROM registrations").fetchone()[0] == 5
+
+        emails = {
+            r["id"]: r["email"]
+            for r in conn.execute("SELECT id, email FROM registrations")
+        }
+        assert [emails[i] for i in ids] == [r["email"] for r in regs]
+
+    print("✅ save_registrations_bulk row counts")
+
+
+def test_save_goals_bulk_counts():
+    """Test bulk goal insert returns the number of rows written"""
+    with temp_db() as conn:
+        db.init_db()
+        assert db.save_goals_bulk([]) == 0
+
+        goals = [make_goal(f"GOAL_BULK_{i}", registration_id=3) for i in range(4)]
+        assert db.save_goals_bulk(goals) == 4
+
+        assert conn.execute("SELECT COUNT(*) FROM goals").fetchone()[0] == 4
+        assert len(db.get_user_goals(3)) == 4
+
+    print("✅ save_goals_bulk row counts")
+
+
+def test_path_change_closes_old_connection():
+    """Test switching ROBO_DB_PATH closes the previous thread connection"""
+    with temp_db() as old_conn:
+        old_path = os.environ["ROBO_DB_PATH"]
+        os.environ["ROBO_DB_PATH"] = old_path + ".other"
+
+        new_conn = db.get_connection()
+        assert new_conn is not old_conn
+
+        try:
+            old_conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            pass
+        else:
+            raise AssertionError("old connection was left open")
+
+    print("✅ Path change closes the old connection")
+
+
+# ===================================================================
+# RUN ALL TESTS
+# ===================================================================
+
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("Running Database Unit Tests")
+    print("="*70 + "\n")
+
+    try:
+        test_legacy_goals_migration_keeps_rows()
+        test_init_db_rerun_is_noop()
+        test_save_or_update_goal_updates_in_place()
+        test_save_registrations_bulk_counts()
+        test_save_goals_bulk_counts()
+        test_path_change_closes_old_connection()
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED!")
+        print("="*70 + "\n")
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
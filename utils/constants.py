@@ -279,6 +279,23 @@ VOLATILITY_BENCHMARKS = {
     "Low": float('inf')        # Volatility > 10% = Low confidence
 }
 
+# Confidence label for every (age bucket, volatility bucket) pair,
+# indexed age_bucket * 3 + vol_bucket. Buckets count thresholds missed:
+# vol 0 = <=5%, 1 = <=10%, 2 = >10%; age 0 = >=10y, 1 = 5-9y, 2 = <5y.
+# Precomputed from the weighted score (vol*0.7 + age*0.3 vs 1.5/2.5).
+CONFIDENCE_TABLE = (
+    "High", "Medium", "Medium",
+    "High", "Medium", "Low",
+    "Medium", "Medium", "Low",
+)
+
+# Approximate percentage per confidence level (unknown levels map to 50)
+CONFIDENCE_PERCENTAGES = {
+    "High": 70,      # ~70% confidence (conservative)
+    "Medium": 50,    # ~50% confidence (expected)
+    "Low": 25        # ~25% confidence (best case)
+}
+
 # ===================================================================
 # CSV & DATA CONSTANTS
 # ===================================================================
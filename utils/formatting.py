@@ -4,7 +4,7 @@ Formatting utilities for currency, percentages, etc.
 """
 
 import locale
-from typing import Optional
+from typing import Iterable, List, Optional
 
 try:
     locale.setlocale(locale.LC_MONETARY, "en_IN")
@@ -32,3 +32,31 @@ def format_currency(value: Optional[float]) -> str:
     if value is None:
         return "₹0"
     return f"₹{locale.format_string('%d', float(value), grouping=True)}"
+
+
+def format_percentage_many(values: Iterable[Optional[float]]) -> List[str]:
+    """Format several values as percentages in one pass (see format_percentage)."""
+    return [
+        "N/A" if value is None else f"{float(value):.2f}%"
+        for value in values
+    ]
+
+
+def format_crores_many(values: Iterable[Optional[float]]) -> List[str]:
+    """Format several values as crores in one pass (see format_crores)."""
+    format_string = locale.format_string
+    return [
+        "₹0 Cr." if value is None
+        else f"₹{format_string('%d', float(value), grouping=True)} Cr."
+        for value in values
+    ]
+
+
+def format_currency_many(values: Iterable[Optional[float]]) -> List[str]:
+    """Format several values as Indian currency in one pass (see format_currency)."""
+    format_string = locale.format_string
+    return [
+        "₹0" if value is None
+        else f"₹{format_string('%d', float(value), grouping=True)}"
+        for value in values
+    ]
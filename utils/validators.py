@@ -7,7 +7,10 @@ import re
 
 EMAIL_REGEX = re.compile(r"^[^\@\s]+@[^\@\s]+\.[^\@\s]+$")
 
+# Bound method hoisted once; is_valid_email runs on every form rerun.
+_EMAIL_FULLMATCH = EMAIL_REGEX.fullmatch
+
 
 def is_valid_email(email: str) -> bool:
     """Validate email format (basic regex check)."""
-    return bool(EMAIL_REGEX.match(email.strip()))
+    return _EMAIL_FULLMATCH(email.strip()) is not None